@@ -4,15 +4,92 @@
 展示如何使用配置文件来管理爬虫设置
 """
 
-import asyncio
 import csv
 import json
 import re
-import time
+import sys
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Dict, List
 
 from xpidy import ExtractionConfig, Spider, SpiderConfig, XpidyConfig
+from xpidy.utils import run_async
+
+# 链接URL中需要保留的路径关键词
+LINK_URL_PATTERNS = ("yaowenn", "scdcn", "toutiao", "djcf")
+
+# 违纪处分关键词
+CASE_KEYWORDS = ("被开除党籍", '被"双开"', "被取消", "被撤销")
+
+# 链接文本关键词（违纪、开除等）
+LINK_TEXT_KEYWORDS = ("违纪", "开除", "党籍")
+
+# 行末日期
+DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})$")
+
+# 职务词汇列表（按长度排序，长的优先匹配）
+JOB_TITLES = (
+    "总法律顾问",
+    "(主持工作)",
+    "总会计师",
+    "党组成员",
+    "总工程师",
+    "总经济师",
+    "总审计师",
+    "总规划师",
+    "总设计师",
+    "总指挥",
+    "总编辑",
+    "总裁判",
+    "秘书长",
+    "检察长",
+    "总经理",
+    "董事长",
+    "巡视员",
+    "督察员",
+    "特派员",
+    "研究员",
+    "负责人",
+    "监事长",
+    "专家",
+    "队长",
+    "督办",
+    "专员",
+    "司长",
+    "书记",
+    "州长",
+    "干部",
+    "组长",
+    "主任",
+    "委员",
+    "常委",
+    "厅长",
+    "局长",
+    "院长",
+    "董事",
+    "经理",
+    "主席",
+    "部长",
+    "省长",
+    "市长",
+    "区长",
+    "县长",
+    "镇长",
+    "处长",
+    "科长",
+    "秘书",
+    "视员",
+    "关长",
+    "行长",
+    "署长",
+    "参事",
+    "助理",
+    "顾问",
+    "理事",
+    "监事",
+    "总裁",
+    "总监",
+)
 
 
 def load_config(config_path: str = "ccdi_config.json") -> tuple:
@@ -52,7 +129,7 @@ async def main():
     print(f"⚡ 并发数: {concurrent_config.get('max_concurrent', 3)}")
     print()
 
-    start_time = time.time()
+    start_time = perf_counter()
 
     # 🔥 使用配置文件中的并发设置
     async with Spider(config) as spider:
@@ -62,12 +139,14 @@ async def main():
             delay_between_batches=concurrent_config.get("delay_between_batches", 0.5),
         )
 
-    end_time = time.time()
+    end_time = perf_counter()
 
     # 📊 处理结果
     all_cases = []
+    success_count = 0
     for result in results:
         if "error" not in result:
+            success_count += 1
             page_type = get_page_type(result["url"])
             cases = extract_cases_from_result(result)
 
@@ -80,7 +159,7 @@ async def main():
     save_to_csv(all_cases, csv_filename, output_config)
 
     # 📈 显示统计
-    print_summary(results, all_cases, end_time - start_time)
+    print_summary(results, success_count, all_cases, end_time - start_time)
 
 
 def get_page_type(url: str) -> str:
@@ -114,10 +193,7 @@ def extract_cases_from_result(result: Dict[str, Any]) -> List[Dict[str, str]]:
             link_text = link["text"].strip()
 
             # 扩大链接范围：包含更多类型的链接
-            if any(
-                pattern in link_url
-                for pattern in ["yaowenn", "scdcn", "toutiao", "djcf"]
-            ):
+            if any(pattern in link_url for pattern in LINK_URL_PATTERNS):
                 full_url = (
                     f"https://www.ccdi.gov.cn{link_url}"
                     if not link_url.startswith("http")
@@ -134,12 +210,9 @@ def extract_cases_from_result(result: Dict[str, Any]) -> List[Dict[str, str]]:
             continue
 
         # 匹配包含违纪处分关键词的行
-        if any(
-            keyword in line
-            for keyword in ["被开除党籍", '被"双开"', "被取消", "被撤销"]
-        ):
+        if any(keyword in line for keyword in CASE_KEYWORDS):
             # 尝试从行末提取日期
-            date_match = re.search(r"(\d{4}-\d{2}-\d{2})$", line)
+            date_match = DATE_PATTERN.search(line)
             if date_match:
                 date = date_match.group(1)
                 # 移除日期部分得到标题
@@ -169,7 +242,7 @@ def extract_cases_from_result(result: Dict[str, Any]) -> List[Dict[str, str]]:
                             match_score = 60
                         # 5. 关键词匹配（违纪、开除等）
                         elif any(
-                            keyword in link_text for keyword in ["违纪", "开除", "党籍"]
+                            keyword in link_text for keyword in LINK_TEXT_KEYWORDS
                         ):
                             # 检查是否有共同的关键词
                             title_words = set(title.split())
@@ -201,73 +274,9 @@ def extract_cases_from_result(result: Dict[str, Any]) -> List[Dict[str, str]]:
 def extract_name_from_title(title: str) -> str:
     """从标题中提取人名 - 匹配最后一个职务到严重/被之间的内容"""
 
-    # 职务词汇列表（按长度排序，长的优先匹配）
-    job_titles = [
-        "总法律顾问",
-        "(主持工作)",
-        "总会计师",
-        "党组成员",
-        "总工程师",
-        "总经济师",
-        "总审计师",
-        "总规划师",
-        "总设计师",
-        "总指挥",
-        "总编辑",
-        "总裁判",
-        "秘书长",
-        "检察长",
-        "总经理",
-        "董事长",
-        "巡视员",
-        "督察员",
-        "特派员",
-        "研究员",
-        "负责人",
-        "监事长",
-        "专家",
-        "队长",
-        "督办",
-        "专员",
-        "司长",
-        "书记",
-        "州长",
-        "干部",
-        "组长",
-        "主任",
-        "委员",
-        "常委",
-        "厅长",
-        "局长",
-        "院长",
-        "董事",
-        "经理",
-        "主席",
-        "部长",
-        "省长",
-        "市长",
-        "区长",
-        "县长",
-        "镇长",
-        "处长",
-        "科长",
-        "秘书",
-        "视员",
-        "关长",
-        "行长",
-        "署长",
-        "参事",
-        "助理",
-        "顾问",
-        "理事",
-        "监事",
-        "总裁",
-        "总监",
-    ]
-
     # 找到所有职务词汇的位置
     job_positions = []
-    for job in job_titles:
+    for job in JOB_TITLES:
         start_pos = 0
         while True:
             pos = title.find(job, start_pos)
@@ -275,7 +284,7 @@ def extract_name_from_title(title: str) -> str:
                 break
             # 检查是否被更长的职务词汇包含
             is_part_of_longer = False
-            for longer_job in job_titles:
+            for longer_job in JOB_TITLES:
                 if len(longer_job) > len(job) and job in longer_job:
                     # 检查是否存在更长的匹配
                     longer_pos = title.find(
@@ -348,31 +357,37 @@ def save_to_csv(cases: List[Dict[str, str]], filename: str, output_config: Dict)
     print(f"📋 包含字段: {', '.join(fieldnames)}")
 
 
-def print_summary(results: List[Dict], cases: List[Dict], total_time: float):
+def print_summary(
+    results: List[Dict], success_count: int, cases: List[Dict], total_time: float
+):
     """打印爬取摘要"""
-    success_count = len([r for r in results if "error" not in r])
     total_urls = len(results)
 
-    print("\n" + "=" * 60)
-    print("📊 爬取结果摘要")
-    print("=" * 60)
-    print(f"✅ 成功页面: {success_count}/{total_urls}")
-    print(f"📋 提取案例: {len(cases)} 个")
-    print(f"⏱️  总耗时: {total_time:.2f} 秒")
-    print(f"⚡ 平均速度: {len(results)/total_time:.1f} 页面/秒")
-
     # 按页面类型统计
     type_stats = {}
     for case in cases:
         page_type = case["页面类型"]
         type_stats[page_type] = type_stats.get(page_type, 0) + 1
 
-    print(f"\n📈 分类统计:")
-    for page_type, count in type_stats.items():
-        print(f"   {page_type}: {count} 个案例")
+    # 汇总所有输出行后一次性写出
+    lines = [
+        "\n" + "=" * 60,
+        "📊 爬取结果摘要",
+        "=" * 60,
+        f"✅ 成功页面: {success_count}/{total_urls}",
+        f"📋 提取案例: {len(cases)} 个",
+        f"⏱️  总耗时: {total_time:.2f} 秒",
+        f"⚡ 平均速度: {len(results)/total_time:.1f} 页面/秒",
+        "\n📈 分类统计:",
+    ]
+    lines.extend(
+        f"   {page_type}: {count} 个案例" for page_type, count in type_stats.items()
+    )
+    lines.append("\n🎉 爬取完成！数据已保存为CSV格式")
 
-    print(f"\n🎉 爬取完成！数据已保存为CSV格式")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -0,0 +1,33 @@
+"""
+命令行接口单元测试
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from xpidy.cli import cli
+
+
+class TestRunCommand:
+    """run 命令测试（不启动浏览器）"""
+
+    @pytest.mark.parametrize("concurrency", [0, -1, "2", True])
+    def test_rejects_invalid_concurrency(self, tmp_path, concurrency):
+        """测试 concurrency 不是不小于1的整数时报参数错误"""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "tasks": [{"url": "https://example.com"}],
+                    "concurrency": concurrency,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        result = CliRunner().invoke(cli, ["run", str(config_file)])
+
+        assert result.exit_code == 2
+        assert "concurrency" in result.output
@@ -0,0 +1,23 @@
+"""
+LLM处理器单元测试
+"""
+
+from jinja2 import Environment
+
+from xpidy.core.llm_processor import _compile_template, _ContentTemplate
+
+
+class TestCompileTemplate:
+    """提示词模板编译测试"""
+
+    def test_simple_template_uses_fast_path(self):
+        """测试只含内容占位符的模板跳过Jinja2渲染"""
+        for source in ["摘要：{content}", "摘要：{{ content }}", "摘要：{{content}}"]:
+            template = _compile_template(Environment(), source)
+            assert isinstance(template, _ContentTemplate)
+            assert template.render(content="正文") == "摘要：正文"
+
+    def test_mixed_template_replaces_single_brace_content(self):
+        """测试 {content} 与其他Jinja2语法混用时同样被替换"""
+        template = _compile_template(Environment(), "标题：{{ title }}\n{content}")
+        assert template.render(content="正文", title="新闻") == "标题：新闻\n正文"
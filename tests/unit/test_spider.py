@@ -0,0 +1,74 @@
+"""
+爬虫核心类单元测试
+"""
+
+from xpidy.core.config import ExtractionConfig, SpiderConfig, XpidyConfig
+from xpidy.core.spider import Spider
+from xpidy.extractors import (
+    DataExtractor,
+    FormExtractor,
+    ImageExtractor,
+    LinkExtractor,
+    TextExtractor,
+)
+
+
+class TestSpiderInit:
+    """爬虫初始化测试（不启动浏览器）"""
+
+    def test_form_extractor_enabled(self):
+        """测试启用表单提取器时能正确构建"""
+        spider = Spider(
+            XpidyConfig(extraction_config=ExtractionConfig(enable_form=True))
+        )
+        assert isinstance(spider._extractors["form"], FormExtractor)
+        assert spider._extractor_names == ("form",)
+
+    def test_all_extractors_enabled(self):
+        """测试启用全部提取器时均能正确构建"""
+        spider = Spider(
+            XpidyConfig(
+                extraction_config=ExtractionConfig(
+                    enable_text=True,
+                    enable_links=True,
+                    enable_images=True,
+                    enable_data=True,
+                    enable_form=True,
+                )
+            )
+        )
+        assert isinstance(spider._extractors["text"], TextExtractor)
+        assert isinstance(spider._extractors["links"], LinkExtractor)
+        assert isinstance(spider._extractors["images"], ImageExtractor)
+        assert isinstance(spider._extractors["data"], DataExtractor)
+        assert isinstance(spider._extractors["form"], FormExtractor)
+        assert spider._extractor_names == ("text", "links", "images", "data", "form")
+
+    def test_navigation_retry_opt_in(self):
+        """测试导航重试默认关闭，开启后按 retry_times 重试且受超时时间约束"""
+        spider = Spider(XpidyConfig())
+        assert spider._nav_retry.config.max_attempts == 1
+
+        spider = Spider(
+            XpidyConfig(
+                spider_config=SpiderConfig(
+                    retry_navigation=True, retry_times=2, timeout=10000
+                )
+            )
+        )
+        assert spider._nav_retry.config.max_attempts == 3
+        assert spider._nav_retry.config.max_total_time == 10.0
+
+    def test_invalid_link_pattern_is_skipped(self):
+        """测试无效的链接过滤正则被跳过，不影响Spider构建"""
+        spider = Spider(
+            XpidyConfig(
+                extraction_config=ExtractionConfig(
+                    enable_links=True,
+                    links_config={"include_patterns": ["(", "/news/"]},
+                )
+            )
+        )
+        links = spider._extractors["links"]
+        assert links._matches_patterns("https://example.com/news/1")
+        assert not links._matches_patterns("https://example.com/about")
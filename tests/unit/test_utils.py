@@ -3,11 +3,24 @@
 """
 
 import asyncio
+import time
 
 import pytest
-
-from xpidy.utils import CacheManager, ContentUtils, StatsCollector, URLUtils
+from playwright.async_api import Error as PlaywrightError
+
+from xpidy.core.spider import _is_transient_navigation_error
+from xpidy.utils import (
+    CacheManager,
+    ContentUtils,
+    StatsCollector,
+    TokenBucket,
+    URLUtils,
+    json_dumps,
+    json_loads,
+    run_async,
+)
 from xpidy.utils.cache import CacheConfig
+from xpidy.utils.retry import RetryConfig, RetryManager, RetryStrategy
 
 
 class TestURLUtils:
@@ -36,6 +49,29 @@ class TestURLUtils:
         assert URLUtils.extract_domain("http://example.com") == "example.com"
         assert URLUtils.extract_domain("invalid") is None
 
+    def test_parse_all(self):
+        """测试单次解析得到有效性、标准化URL和域名"""
+        assert URLUtils.parse_all("https://Example.com:443") == (
+            True,
+            "https://Example.com/",
+            "example.com:443",
+        )
+        assert URLUtils.parse_all("not-a-url") == (False, "", None)
+
+        for url in ["https://example.com/a?b=1", "http://example.com:80/"]:
+            is_valid, normalized, domain = URLUtils.parse_all(url)
+            assert is_valid == URLUtils.is_valid_url(url)
+            assert normalized == URLUtils.normalize_url(url)
+            assert domain == URLUtils.extract_domain(url)
+
+    def test_non_string_url_inputs(self):
+        """测试非字符串（含不可哈希）输入返回默认值而不报错"""
+        for value in [["https://example.com"], {"url": "https://example.com"}, None]:
+            assert URLUtils.is_valid_url(value) is False
+            assert URLUtils.extract_domain(value) is None
+            assert URLUtils.get_file_extension_from_url(value) is None
+            assert URLUtils.parse_all(value) == (False, "", None)
+
     def test_extract_base_domain(self):
         """测试基础域名提取"""
         assert URLUtils.extract_base_domain("https://www.example.com") == "example.com"
@@ -62,6 +98,21 @@ class TestURLUtils:
             == "https://example.com/path"
         )
 
+    def test_join_url_relative_forms(self):
+        """测试各种相对URL形式的连接"""
+        base = "https://example.com/docs/guide/index.html"
+        assert URLUtils.join_url(base, "intro.html") == (
+            "https://example.com/docs/guide/intro.html"
+        )
+        assert URLUtils.join_url(base, "../api") == "https://example.com/docs/api"
+        assert URLUtils.join_url(base, "//cdn.example.com/a.js") == (
+            "https://cdn.example.com/a.js"
+        )
+        assert URLUtils.join_url(base, "https://other.com/x") == "https://other.com/x"
+        assert URLUtils.join_url(base, "?page=2") == (
+            "https://example.com/docs/guide/index.html?page=2"
+        )
+
     def test_clean_url_params(self):
         """测试URL参数清理"""
         url = "https://example.com/path?param1=value1&param2=value2"
@@ -84,6 +135,34 @@ class TestURLUtils:
         )
         assert URLUtils.get_file_extension_from_url("https://example.com/page") is None
 
+    def test_compile_patterns(self):
+        """测试逐个编译多个URL模式（忽略大小写）"""
+        admin, pdf = URLUtils.compile_patterns((r"/admin", r"\.PDF$"))
+        assert admin.search("https://example.com/Admin/login")
+        assert pdf.search("https://example.com/doc.pdf")
+        assert not pdf.search("https://example.com/index.html")
+        assert URLUtils.compile_patterns(()) == ()
+
+    def test_compile_url_matcher_keeps_pattern_semantics(self):
+        """测试内联标志和反向引用在多个模式下保持原有含义"""
+        matches = URLUtils.compile_url_matcher((r"(?i)login", r"/(\w+)/\1/"))
+        assert matches("https://example.com/LOGIN")
+        assert matches("https://example.com/a/a/")
+        assert not matches("https://example.com/a/b/")
+
+    def test_compile_url_matcher(self):
+        """测试纯文本模式快速匹配与正则模式混合使用"""
+        matches = URLUtils.compile_url_matcher(
+            (r"^https?://ads\.", r"/logout", r"\.PDF$", r"page=\d+")
+        )
+        assert matches("https://ads.example.com/banner")
+        assert matches("https://example.com/Logout")
+        assert matches("https://example.com/doc.pdf")
+        assert matches("https://example.com/list?page=3")
+        assert not matches("https://example.com/list?page=next")
+        assert not matches("https://example.com/ads.html")
+        assert URLUtils.compile_url_matcher(()) is None
+
     def test_is_media_url(self):
         """测试媒体URL检查"""
         assert URLUtils.is_media_url("https://example.com/image.jpg")
@@ -243,8 +322,6 @@ class TestStatsCollector:
 
     def test_performance_stats(self, stats_collector):
         """测试性能统计"""
-        import time
-
         context = stats_collector.record_request_start("https://example.com", "text")
         time.sleep(0.1)  # 模拟处理时间
 
@@ -253,3 +330,136 @@ class TestStatsCollector:
         summary = stats_collector.get_summary()
         assert summary["performance"]["avg_duration"] > 0
         assert summary["performance"]["min_duration"] > 0
+
+
+class TestRunAsync:
+    """事件循环工具测试"""
+
+    def test_run_async_returns_result(self):
+        """测试运行协程并返回结果"""
+
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert run_async(add(1, 2)) == 3
+
+    def test_run_async_uses_eager_tasks(self):
+        """测试无需等待的任务在创建时即完成"""
+
+        async def immediate():
+            return "done"
+
+        async def main():
+            task = asyncio.create_task(immediate())
+            return task.done()
+
+        assert run_async(main()) is True
+
+
+class TestJsonUtils:
+    """JSON工具测试"""
+
+    def test_round_trip(self):
+        """测试序列化与解析往返"""
+        data = {"title": "中文标题", "items": [1, 2, 3], "nested": {"ok": True}}
+        assert json_loads(json_dumps(data)) == data
+        assert json_loads(json_dumps(data, indent=True).encode("utf-8")) == data
+
+    def test_dumps_keeps_non_ascii(self):
+        """测试保留非ASCII字符"""
+        assert "中文" in json_dumps({"text": "中文"})
+        assert "\n  " in json_dumps({"a": 1}, indent=True)
+
+
+class TestTokenBucket:
+    """令牌桶限流器测试"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity(self):
+        """测试容量内立即获取"""
+        bucket = TokenBucket(rate=1, capacity=5)
+        await asyncio.wait_for(bucket.acquire(5), timeout=0.5)
+        assert bucket.available < 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """测试令牌不足时等待补充"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_acquire_over_capacity(self):
+        """测试超过容量时报错"""
+        bucket = TokenBucket(rate=1, capacity=2)
+        with pytest.raises(ValueError):
+            await bucket.acquire(3)
+
+
+class TestRetryManager:
+    """重试管理器测试"""
+
+    def test_decorrelated_delay_range(self):
+        """测试去相关抖动延迟落在递增区间内且受最大延迟限制"""
+        config = RetryConfig(
+            strategy=RetryStrategy.DECORRELATED,
+            base_delay=1.0,
+            max_delay=5.0,
+            jitter=False,
+        )
+        manager = RetryManager(config)
+        for _ in range(50):
+            assert 1.0 <= manager._calculate_delay(0, config) <= 3.0
+            assert 1.0 <= manager._calculate_delay(3, config) <= 5.0
+
+    @pytest.mark.asyncio
+    async def test_retry_if_rejects_without_retrying(self):
+        """测试不满足重试条件的异常直接抛出，不再重试"""
+        calls = []
+
+        async def navigate(message):
+            calls.append(message)
+            raise PlaywrightError(message)
+
+        config = RetryConfig(
+            max_attempts=3,
+            base_delay=0.0,
+            jitter=False,
+            retry_on_exceptions=[PlaywrightError],
+            retry_if=_is_transient_navigation_error,
+        )
+        manager = RetryManager(config)
+
+        with pytest.raises(PlaywrightError):
+            await manager.retry_async(navigate, "net::ERR_NAME_NOT_RESOLVED")
+        assert len(calls) == 1
+
+        calls.clear()
+        with pytest.raises(PlaywrightError):
+            await manager.retry_async(navigate, "net::ERR_CONNECTION_RESET")
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_max_total_time_stops_retrying(self):
+        """测试下次等待将超过总时长上限时不再重试"""
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            raise ValueError("fail")
+
+        config = RetryConfig(
+            max_attempts=5,
+            strategy=RetryStrategy.FIXED,
+            base_delay=0.05,
+            jitter=False,
+            max_total_time=0.08,
+        )
+        manager = RetryManager(config)
+
+        with pytest.raises(ValueError):
+            await manager.retry_async(fail)
+        assert len(calls) == 2
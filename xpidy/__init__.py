@@ -2,8 +2,12 @@
 Xpidy - 配置驱动的智能网页数据提取框架
 """
 
-from .core.config import ExtractionConfig, LLMConfig, SpiderConfig, XpidyConfig
-from .core.spider import Spider
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.config import ExtractionConfig, LLMConfig, SpiderConfig, XpidyConfig
+    from .core.spider import Spider
 
 __version__ = "0.2.0"
 __author__ = "Xpidy Team"
@@ -22,3 +26,27 @@ __all__ = [
     "__author__",
     "__description__",
 ]
+
+# 延迟导入表：属性名 -> (模块, 属性)，首次访问时才加载 Playwright 等重量级依赖
+_LAZY_IMPORTS = {
+    "Spider": (".core.spider", "Spider"),
+    "XpidyConfig": (".core.config", "XpidyConfig"),
+    "SpiderConfig": (".core.config", "SpiderConfig"),
+    "ExtractionConfig": (".core.config", "ExtractionConfig"),
+    "LLMConfig": (".core.config", "LLMConfig"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入公开属性（PEP 562）"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr_name = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,16 +2,156 @@
 Xpidy 配置驱动的命令行工具
 """
 
-import asyncio
+import io
 import json
+import re
 import sys
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import click
 
 from . import Spider, XpidyConfig
-from .utils import URLUtils
+from .utils import URLUtils, json_dumps, json_loads, run_async
+
+# http(s) URL 快速校验
+_HTTP_URL_RE = re.compile(r"^https?://[^\s/$.?#\[\]][^\s\[\]]*$", re.IGNORECASE)
+
+# 各提取器结果摘要的格式化函数
+_SUMMARY_FORMATTERS = {
+    "text": lambda r: f"  文本长度: {len(r.get('content', ''))}字符",
+    "links": lambda r: f"  链接数量: {r.get('total_links', 0)}",
+    "images": lambda r: f"  图片数量: {r.get('total_images', 0)}",
+    "data": lambda r: f"  结构化数据: {r.get('stats', {})}",
+}
+
+
+# 配置文件模板（init 命令使用）
+_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "basic": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "text_config": {"extract_metadata": True, "min_text_length": 10},
+        },
+        "tasks": [{"url": "https://example.com", "name": "example_basic"}],
+    },
+    "links": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "enable_links": True,
+            "links_config": {
+                "include_internal": True,
+                "include_external": True,
+                "max_items": 50,
+            },
+        },
+        "tasks": [{"url": "https://example.com", "name": "example_links"}],
+    },
+    "images": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "enable_images": True,
+            "images_config": {
+                "min_width": 100,
+                "min_height": 100,
+                "max_items": 20,
+                "allowed_formats": ["jpg", "png", "gif"],
+            },
+        },
+        "tasks": [{"url": "https://example.com", "name": "example_images"}],
+    },
+    "comprehensive": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "enable_links": True,
+            "enable_images": True,
+            "enable_data": True,
+            "enable_form": True,
+            "text_config": {"extract_metadata": True},
+            "links_config": {"max_items": 100},
+            "images_config": {"max_items": 30},
+            "data_config": {"extract_json_ld": True, "extract_tables": True},
+            "form_config": {"extract_input_fields": True},
+        },
+        "tasks": [{"url": "https://example.com", "name": "comprehensive_extraction"}],
+    },
+    "data": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "enable_data": True,
+            "data_config": {
+                "extract_json_ld": True,
+                "extract_microdata": True,
+                "extract_opengraph": True,
+                "extract_tables": True,
+                "extract_lists": True,
+            },
+        },
+        "tasks": [{"url": "https://example.com", "name": "data_extraction"}],
+    },
+    "form": {
+        "spider_config": {"headless": True, "timeout": 30000},
+        "extraction_config": {
+            "enable_text": True,
+            "enable_form": True,
+            "form_config": {
+                "extract_input_fields": True,
+                "extract_buttons": True,
+                "extract_selects": True,
+                "include_hidden_fields": False,
+            },
+        },
+        "tasks": [{"url": "https://example.com", "name": "form_extraction"}],
+    },
+}
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float) -> Dict[str, Any]:
+    """读取并解析配置文件，按 (路径, 修改时间) 缓存，返回值不应被修改"""
+    # 直接解析UTF-8字节，省去文本解码
+    return json_loads(Path(path).read_bytes())
+
+
+class _BufferedEcho:
+    """输出流不是终端时缓冲输出，在任务边界批量写出"""
+
+    def __init__(self, err: bool = False):
+        self._err = err
+        self._stream = click.get_text_stream("stderr" if err else "stdout")
+        self._buffer = None if self._stream.isatty() else io.StringIO()
+
+    def echo(self, message: str = ""):
+        """输出一行（终端直接输出，否则写入缓冲区）"""
+        if self._buffer is None:
+            click.echo(message, err=self._err)
+        else:
+            self._buffer.write(message + "\n")
+
+    def flush(self):
+        """写出缓冲区内容"""
+        if self._buffer is not None and self._buffer.tell():
+            self._stream.write(self._buffer.getvalue())
+            self._stream.flush()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+
+def _read_config_file(config_file: str) -> Dict[str, Any]:
+    """读取配置文件，文件不存在时输出错误并退出"""
+    try:
+        mtime = Path(config_file).stat().st_mtime
+        return _load_config(config_file, mtime)
+    except FileNotFoundError:
+        click.echo(f"❌ 配置文件不存在: {config_file}", err=True)
+        sys.exit(1)
 
 
 @click.group()
@@ -28,7 +168,14 @@ def cli():
 @click.argument("config_file")
 @click.option("--output", "-o", help="输出文件路径")
 @click.option("--dry-run", is_flag=True, help="预览配置而不执行")
-def run(config_file: str, output: Optional[str], dry_run: bool):
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "jsonl"]),
+    default="json",
+    help="输出格式：json 汇总输出，jsonl 每完成一个任务写出一行",
+)
+def run(config_file: str, output: Optional[str], dry_run: bool, output_format: str):
     """使用配置文件执行爬取任务
 
     示例配置文件：
@@ -50,20 +197,32 @@ def run(config_file: str, output: Optional[str], dry_run: bool):
           "url": "https://example.com",
           "name": "example_site"
         }
-      ]
+      ],
+      "concurrency": 3
     }
+
+    concurrency 为任务并发数（可选，默认3，须为不小于1的整数）。
     """
 
     async def run_task():
         try:
             # 读取配置文件
-            config_path = Path(config_file)
-            if not config_path.exists():
-                click.echo(f"❌ 配置文件不存在: {config_file}", err=True)
-                sys.exit(1)
+            config_data = _read_config_file(config_file)
+
+            tasks = config_data.get("tasks", [])
 
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            if dry_run:
+                # 预览直接展示原始配置，不构建模型（校验请使用 validate 命令）
+                spider_config = config_data.get("spider_config", {})
+                extraction_config = config_data.get("extraction_config", {})
+                llm_config = config_data.get("llm_config", {})
+                click.echo("🔍 配置预览:")
+                click.echo(f"  爬虫配置: {json_dumps(spider_config)}")
+                click.echo(f"  提取配置: {json_dumps(extraction_config)}")
+                if llm_config.get("enabled"):
+                    click.echo(f"  LLM配置: {json_dumps(llm_config)}")
+                click.echo(f"  任务数量: {len(tasks)}")
+                return
 
             # 解析配置 - 使用新的统一配置
             try:
@@ -72,81 +231,131 @@ def run(config_file: str, output: Optional[str], dry_run: bool):
                 click.echo(f"❌ 配置解析失败: {e}", err=True)
                 sys.exit(1)
 
-            tasks = config_data.get("tasks", [])
-
-            if dry_run:
-                click.echo("🔍 配置预览:")
-                click.echo(f"  爬虫配置: {config.spider_config}")
-                click.echo(f"  提取配置: {config.extraction_config}")
-                if config.llm_config.enabled:
-                    click.echo(f"  LLM配置: {config.llm_config}")
-                click.echo(f"  任务数量: {len(tasks)}")
-                return
-
             if not tasks:
                 click.echo("❌ 配置文件中没有任务", err=True)
                 sys.exit(1)
 
-            # 执行任务
-            click.echo(f"🚀 开始执行 {len(tasks)} 个任务")
-
-            async with Spider(config) as spider:
-                results = {}
+            concurrency = config_data.get("concurrency", 3)
+            if (
+                not isinstance(concurrency, int)
+                or isinstance(concurrency, bool)
+                or concurrency < 1
+            ):
+                raise click.BadParameter(
+                    f"必须为不小于1的整数，当前为: {concurrency!r}",
+                    param_hint="'concurrency'",
+                )
+
+            # jsonl 格式逐条写出结果，不在内存中保留全部结果
+            stream = output_format == "jsonl"
+            # jsonl 写到 stdout 时进度信息改走 stderr，保证 stdout 可直接交给下游解析
+            progress_err = stream and not output
+            results = {}
+            successful = 0
+            out = _BufferedEcho()
+            log = _BufferedEcho(err=progress_err)
 
-                for i, task in enumerate(tasks, 1):
-                    url = task["url"]
-                    name = task.get("name", f"task_{i}")
-
-                    try:
-                        click.echo(f"📥 ({i}/{len(tasks)}) 处理: {name} - {url}")
+            # 执行任务
+            click.echo(f"🚀 开始执行 {len(tasks)} 个任务", err=progress_err)
+
+            stream_target = nullcontext()
+            if stream and output:
+                stream_target = open(output, "w", encoding="utf-8")
+            with stream_target as stream_file:
+
+                def record(name: str, entry: Dict[str, Any]):
+                    """记录单个任务结果"""
+                    nonlocal successful
+                    if entry["success"]:
+                        successful += 1
+                    if not stream:
+                        results[name] = entry
+                        return
+                    line = json_dumps({"name": name, **entry})
+                    if stream_file:
+                        stream_file.write(line + "\n")
+                        stream_file.flush()
+                    else:
+                        out.echo(line)
+
+                async with Spider(config) as spider:
+                    pending = []
+                    for i, task in enumerate(tasks, 1):
+                        name = task.get("name", f"task_{i}")
+                        url = task.get("url")
+                        if not stream:
+                            # 预先按任务顺序占位，结果按完成顺序回填
+                            results[name] = None
+                        if not url:
+                            log.echo(f"❌ 失败: {name} - 缺少 url 字段")
+                            record(
+                                name,
+                                {
+                                    "url": url,
+                                    "success": False,
+                                    "error": "缺少 url 字段",
+                                },
+                            )
+                            continue
 
                         # 任务级别的配置覆盖
                         task_options = task.get("options", {})
-                        prompt = task_options.get("prompt")
+                        pending.append((name, url, task_options.get("prompt")))
 
-                        result = await spider.crawl(url, prompt=prompt)
+                    log.echo(f"⚡ 并发数: {concurrency}")
+                    out.flush()
+                    log.flush()
+
+                    done = 0
+                    async for result in spider.crawl_multiple_urls_iter(
+                        [url for _, url, _ in pending],
+                        prompts=[prompt for _, _, prompt in pending],
+                        max_concurrent=concurrency,
+                    ):
+                        name, url, _ = pending[result.pop("batch_index") - 1]
+                        done += 1
 
                         # 判断成功状态
                         success = "error" not in result
+                        record(name, {"url": url, "success": success, "data": result})
 
-                        results[name] = {
-                            "url": url,
-                            "success": success,
-                            "data": result,
-                        }
-
+                        progress = f"({done}/{len(pending)})"
                         if success:
-                            click.echo(f"✅ 完成: {name}")
+                            log.echo(f"✅ {progress} 完成: {name} - {url}")
                         else:
-                            click.echo(f"⚠️ 部分完成: {name}")
-
-                    except Exception as e:
-                        click.echo(f"❌ 失败: {name} - {e}")
-                        results[name] = {"url": url, "success": False, "error": str(e)}
+                            log.echo(f"⚠️ {progress} 部分完成: {name} - {url}")
+                        out.flush()
+                        log.flush()
 
-                # 保存结果
+            # 保存结果
+            if not stream:
                 if output:
                     with open(output, "w", encoding="utf-8") as f:
-                        json.dump(results, f, ensure_ascii=False, indent=2)
-                    click.echo(f"✅ 结果已保存到: {output}")
+                        f.write(json_dumps(results, indent=True))
                 else:
-                    click.echo(json.dumps(results, ensure_ascii=False, indent=2))
+                    click.echo(json_dumps(results, indent=True))
+            if output:
+                click.echo(f"✅ 结果已保存到: {output}")
 
-                # 显示总结
-                successful = sum(1 for r in results.values() if r.get("success", False))
-                click.echo(f"\n📊 执行总结: 成功 {successful}/{len(tasks)} 个任务")
+            # 显示总结
+            click.echo(
+                f"\n📊 执行总结: 成功 {successful}/{len(tasks)} 个任务",
+                err=progress_err,
+            )
 
+        except click.ClickException:
+            raise
         except Exception as e:
             click.echo(f"❌ 执行失败: {e}", err=True)
             sys.exit(1)
 
-    asyncio.run(run_task())
+    run_async(run_task())
 
 
 @cli.command()
 @click.argument(
     "template_name",
-    type=click.Choice(["basic", "links", "images", "comprehensive", "data", "form"]),
+    type=click.Choice(list(_TEMPLATES)),
 )
 @click.option("--output", "-o", default="xpidy_config.json", help="配置文件输出路径")
 def init(template_name: str, output: str):
@@ -160,99 +369,14 @@ def init(template_name: str, output: str):
     - data: 结构化数据提取
     - form: 表单数据提取
     """
-    templates = {
-        "basic": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "text_config": {"extract_metadata": True, "min_text_length": 10},
-            },
-            "tasks": [{"url": "https://example.com", "name": "example_basic"}],
-        },
-        "links": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "enable_links": True,
-                "links_config": {
-                    "include_internal": True,
-                    "include_external": True,
-                    "max_items": 50,
-                },
-            },
-            "tasks": [{"url": "https://example.com", "name": "example_links"}],
-        },
-        "images": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "enable_images": True,
-                "images_config": {
-                    "min_width": 100,
-                    "min_height": 100,
-                    "max_items": 20,
-                    "allowed_formats": ["jpg", "png", "gif"],
-                },
-            },
-            "tasks": [{"url": "https://example.com", "name": "example_images"}],
-        },
-        "comprehensive": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "enable_links": True,
-                "enable_images": True,
-                "enable_data": True,
-                "enable_form": True,
-                "text_config": {"extract_metadata": True},
-                "links_config": {"max_items": 100},
-                "images_config": {"max_items": 30},
-                "data_config": {"extract_json_ld": True, "extract_tables": True},
-                "form_config": {"extract_input_fields": True},
-            },
-            "tasks": [
-                {"url": "https://example.com", "name": "comprehensive_extraction"}
-            ],
-        },
-        "data": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "enable_data": True,
-                "data_config": {
-                    "extract_json_ld": True,
-                    "extract_microdata": True,
-                    "extract_opengraph": True,
-                    "extract_tables": True,
-                    "extract_lists": True,
-                },
-            },
-            "tasks": [{"url": "https://example.com", "name": "data_extraction"}],
-        },
-        "form": {
-            "spider_config": {"headless": True, "timeout": 30000},
-            "extraction_config": {
-                "enable_text": True,
-                "enable_form": True,
-                "form_config": {
-                    "extract_input_fields": True,
-                    "extract_buttons": True,
-                    "extract_selects": True,
-                    "include_hidden_fields": False,
-                },
-            },
-            "tasks": [{"url": "https://example.com", "name": "form_extraction"}],
-        },
-    }
-
-    template = templates.get(template_name)
+    template = _TEMPLATES.get(template_name)
     if not template:
         click.echo(f"❌ 未知模板: {template_name}", err=True)
         sys.exit(1)
 
     # 保存模板
     with open(output, "w", encoding="utf-8") as f:
-        json.dump(template, f, ensure_ascii=False, indent=2)
+        f.write(json_dumps(template, indent=True))
 
     click.echo(f"✅ 已生成 {template_name} 配置模板: {output}")
     click.echo(f"🔧 请编辑配置文件后使用: xpidy run {output}")
@@ -263,13 +387,7 @@ def init(template_name: str, output: str):
 def validate(config_file: str):
     """验证配置文件"""
     try:
-        config_path = Path(config_file)
-        if not config_path.exists():
-            click.echo(f"❌ 配置文件不存在: {config_file}", err=True)
-            sys.exit(1)
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = json.load(f)
+        config_data = _read_config_file(config_file)
 
         # 验证配置结构
         errors = []
@@ -284,11 +402,16 @@ def validate(config_file: str):
         if not tasks:
             errors.append("tasks 不能为空")
 
-        for i, task in enumerate(tasks):
-            if "url" not in task:
-                errors.append(f"任务 {i+1} 缺少 url 字段")
-            elif not URLUtils.is_valid_url(task["url"]):
-                errors.append(f"任务 {i+1} 的 URL 无效: {task['url']}")
+        for i, task in enumerate(tasks, 1):
+            url = task.get("url")
+            if url is None:
+                errors.append(f"任务 {i} 缺少 url 字段")
+            # 常见的 http(s) URL 直接由正则判定，其余交给 URLUtils
+            elif not (
+                (isinstance(url, str) and _HTTP_URL_RE.match(url))
+                or URLUtils.is_valid_url(url)
+            ):
+                errors.append(f"任务 {i} 的 URL 无效: {url}")
 
         if errors:
             click.echo("❌ 配置验证失败:")
@@ -300,21 +423,11 @@ def validate(config_file: str):
             click.echo(f"📊 包含 {len(tasks)} 个任务")
 
             # 显示启用的提取器
-            enabled_extractors = []
-            if config.extraction_config.enable_text:
-                enabled_extractors.append("text")
-            if config.extraction_config.enable_links:
-                enabled_extractors.append("links")
-            if config.extraction_config.enable_images:
-                enabled_extractors.append("images")
-            if config.extraction_config.enable_data:
-                enabled_extractors.append("data")
-            if config.extraction_config.enable_form:
-                enabled_extractors.append("form")
+            enabled_extractors = config.extraction_config.get_enabled_extractors()
 
             click.echo(f"🔧 启用的提取器: {', '.join(enabled_extractors)}")
 
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError 为其子类
         click.echo(f"❌ JSON格式错误: {e}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -322,24 +435,53 @@ def validate(config_file: str):
         sys.exit(1)
 
 
+def _echo_quick_summary(result: Dict[str, Any]):
+    """输出单个URL的爬取摘要"""
+    click.echo(f"  成功: {'error' not in result}")
+    click.echo(f"  提取器: {result.get('extractors_used', [])}")
+    click.echo(f"  耗时: {result.get('extraction_time', 0):.2f}秒")
+
+    # 显示各提取器结果统计
+    results = result.get("results", {})
+    for extractor_name, extractor_result in results.items():
+        formatter = _SUMMARY_FORMATTERS.get(extractor_name)
+        if (
+            formatter
+            and isinstance(extractor_result, dict)
+            and "error" not in extractor_result
+        ):
+            click.echo(formatter(extractor_result))
+
+
 @cli.command()
-@click.argument("url")
+@click.argument("urls", nargs=-1, required=True)
 @click.option("--output", "-o", help="输出文件路径")
 @click.option("--enable-links", is_flag=True, help="启用链接提取")
 @click.option("--enable-images", is_flag=True, help="启用图片提取")
 @click.option("--enable-data", is_flag=True, help="启用数据提取")
+@click.option(
+    "--concurrency",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="多个URL时的并发数",
+)
 def quick(
-    url: str,
+    urls: Tuple[str, ...],
     output: Optional[str],
     enable_links: bool,
     enable_images: bool,
     enable_data: bool,
+    concurrency: int,
 ):
-    """快速爬取单个URL（使用默认配置）"""
+    """快速爬取URL（使用默认配置）
+
+    可一次传入多个URL，共用同一个浏览器并发爬取，结果按输入顺序输出为列表。
+    """
 
     async def run_quick():
         try:
-            click.echo(f"🚀 快速爬取: {url}")
+            click.echo(f"🚀 快速爬取: {', '.join(urls)}")
 
             # 创建快速配置
             spider = Spider.quick_create(
@@ -350,12 +492,18 @@ def quick(
             )
 
             async with spider:
-                result = await spider.crawl(url)
-
-            # 判断成功状态
-            success = "error" not in result
-
-            output_data = json.dumps(result, ensure_ascii=False, indent=2)
+                if len(urls) == 1:
+                    results = [await spider.crawl(urls[0])]
+                else:
+                    results = [None] * len(urls)
+                    async for result in spider.crawl_multiple_urls_iter(
+                        list(urls), max_concurrent=concurrency
+                    ):
+                        results[result.pop("batch_index") - 1] = result
+
+            output_data = json_dumps(
+                results[0] if len(results) == 1 else results, indent=True
+            )
 
             if output:
                 with open(output, "w", encoding="utf-8") as f:
@@ -366,35 +514,16 @@ def quick(
 
             # 显示摘要
             click.echo(f"\n📊 爬取摘要:")
-            click.echo(f"  成功: {success}")
-            click.echo(f"  提取器: {result.get('extractors_used', [])}")
-            click.echo(f"  耗时: {result.get('extraction_time', 0):.2f}秒")
-
-            # 显示各提取器结果统计
-            results = result.get("results", {})
-            for extractor_name, extractor_result in results.items():
-                if (
-                    isinstance(extractor_result, dict)
-                    and "error" not in extractor_result
-                ):
-                    if extractor_name == "text":
-                        content_length = len(extractor_result.get("content", ""))
-                        click.echo(f"  文本长度: {content_length}字符")
-                    elif extractor_name == "links":
-                        link_count = extractor_result.get("total_links", 0)
-                        click.echo(f"  链接数量: {link_count}")
-                    elif extractor_name == "images":
-                        image_count = extractor_result.get("total_images", 0)
-                        click.echo(f"  图片数量: {image_count}")
-                    elif extractor_name == "data":
-                        stats = extractor_result.get("stats", {})
-                        click.echo(f"  结构化数据: {stats}")
+            for url, result in zip(urls, results):
+                if len(urls) > 1:
+                    click.echo(f" {url}")
+                _echo_quick_summary(result)
 
         except Exception as e:
             click.echo(f"❌ 快速爬取失败: {e}", err=True)
             sys.exit(1)
 
-    asyncio.run(run_quick())
+    run_async(run_quick())
 
 
 @cli.command()
@@ -407,9 +536,9 @@ def validate_urls(urls):
 
     click.echo("🔍 URL验证结果:")
     for url in urls:
-        is_valid = URLUtils.is_valid_url(url)
-        normalized = URLUtils.normalize_url(url) if is_valid else "无效URL"
-        domain = URLUtils.extract_domain(url) if is_valid else "N/A"
+        is_valid, normalized, domain = URLUtils.parse_all(url)
+        if not is_valid:
+            normalized, domain = "无效URL", "N/A"
 
         status = "✅" if is_valid else "❌"
         click.echo(f"{status} {url}")
@@ -2,8 +2,12 @@
 Xpidy 核心模块
 """
 
-from .config import ExtractionConfig, LLMConfig, SpiderConfig, XpidyConfig
-from .spider import Spider
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ExtractionConfig, LLMConfig, SpiderConfig, XpidyConfig
+    from .spider import Spider
 
 __all__ = [
     "XpidyConfig",
@@ -12,3 +16,27 @@ __all__ = [
     "LLMConfig",
     "Spider",
 ]
+
+# 延迟导入表：避免仅使用配置类时也加载 spider（及 Playwright）
+_LAZY_IMPORTS = {
+    "XpidyConfig": (".config", "XpidyConfig"),
+    "SpiderConfig": (".config", "SpiderConfig"),
+    "ExtractionConfig": (".config", "ExtractionConfig"),
+    "LLMConfig": (".config", "LLMConfig"),
+    "Spider": (".spider", "Spider"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入公开属性（PEP 562）"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr_name = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
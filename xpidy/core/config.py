@@ -2,7 +2,8 @@
 Xpidy 核心配置类
 """
 
-from typing import Any, Dict, List, Optional, Union
+import json
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -17,11 +18,24 @@ class SpiderConfig(BaseModel):
     viewport: Dict[str, int] = Field(
         default_factory=lambda: {"width": 1920, "height": 1080}, description="视口大小"
     )
+    browser_idle_timeout: float = Field(
+        default=0.0, description="浏览器空闲关闭延迟（秒），0表示立即关闭"
+    )
+    max_pages_per_context: int = Field(
+        default=20, description="并发爬取时单个上下文承载的页面数上限，达到后重建"
+    )
+    reuse_page_across_batch: bool = Field(
+        default=False, description="并发爬取时复用页面，URL之间仅重置为空白页"
+    )
 
     # 请求配置
     delay: float = Field(default=1.0, description="请求间隔（秒）")
     retry_times: int = Field(default=3, description="重试次数")
     retry_delay: float = Field(default=2.0, description="重试间隔（秒）")
+    retry_navigation: bool = Field(
+        default=False,
+        description="页面导航遇到超时或瞬时网络错误时按 retry_times 重试，总耗时不超过 timeout",
+    )
 
     # 缓存配置
     enable_cache: bool = Field(default=True, description="启用缓存")
@@ -71,6 +85,19 @@ class ExtractionConfig(BaseModel):
         default_factory=dict, description="表单提取器配置"
     )
 
+    # 提取器名称与启用开关的对应关系
+    EXTRACTOR_FLAGS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("text", "enable_text"),
+        ("links", "enable_links"),
+        ("images", "enable_images"),
+        ("data", "enable_data"),
+        ("form", "enable_form"),
+    )
+
+    def get_enabled_extractors(self) -> List[str]:
+        """获取启用的提取器名称列表"""
+        return [name for name, flag in self.EXTRACTOR_FLAGS if getattr(self, flag)]
+
 
 class LLMConfig(BaseModel):
     """LLM配置"""
@@ -81,12 +108,23 @@ class LLMConfig(BaseModel):
     model: str = Field(default="gpt-3.5-turbo", description="模型名称")
     api_key: Optional[str] = Field(default=None, description="API密钥")
     base_url: Optional[str] = Field(default=None, description="API基础URL")
+    timeout: float = Field(default=60.0, description="请求超时时间（秒）")
+    system_prompt: Optional[str] = Field(default=None, description="默认系统提示词")
+    custom_prompts: Dict[str, str] = Field(
+        default_factory=dict, description="自定义提示词模板，覆盖同名内置模板"
+    )
 
     # 生成参数
     temperature: float = Field(default=0.7, description="温度参数")
     max_tokens: Optional[int] = Field(default=None, description="最大token数")
     top_p: float = Field(default=1.0, description="top_p参数")
 
+    # 输入控制
+    enable_content_truncation: bool = Field(
+        default=True, description="超出输入token上限时截断内容"
+    )
+    max_input_tokens: int = Field(default=8000, description="最大输入token数")
+
     # 缓存配置
     enable_cache: bool = Field(default=True, description="启用LLM缓存")
     cache_ttl: int = Field(default=86400, description="缓存TTL（秒）")
@@ -94,16 +132,40 @@ class LLMConfig(BaseModel):
     # 批处理配置
     batch_size: int = Field(default=10, description="批处理大小")
     batch_delay: float = Field(default=1.0, description="批处理延迟（秒）")
+    adaptive_batch_size: bool = Field(
+        default=False, description="根据批次耗时自动调整批大小"
+    )
+    target_item_latency: float = Field(
+        default=1.0, description="自适应批大小的单项目标耗时（秒）"
+    )
+    max_batch_size: int = Field(default=100, description="自适应批大小上限")
+    requests_per_minute: Optional[int] = Field(
+        default=None, description="每分钟请求数上限，设置后以令牌桶限流替代批处理延迟"
+    )
+    max_concurrent_requests: int = Field(default=5, description="最大并发请求数")
+    batch_api_threshold: Optional[int] = Field(
+        default=None,
+        description="未缓存内容数达到该值时改用提供商 Batch API（离线处理，最长24小时）",
+    )
 
     # 成本控制
     max_cost_per_request: float = Field(
         default=1.0, description="单次请求最大成本（美元）"
     )
     daily_cost_limit: float = Field(default=100.0, description="每日成本限制（美元）")
+    cost_per_token: float = Field(default=0.0, description="每token成本（美元）")
+    enable_stats: bool = Field(default=True, description="启用调用统计")
 
     # 重试配置
     max_retries: int = Field(default=3, description="最大重试次数")
     retry_delay: float = Field(default=1.0, description="重试延迟（秒）")
+    request_timeout: Optional[float] = Field(
+        default=None, description="单次请求超时（秒），超时即重试；为空时使用 timeout"
+    )
+    max_json_retries: int = Field(default=3, description="JSON解析失败最大重试次数")
+    fallback_strategy: str = Field(
+        default="original", description="调用失败时的降级策略：original/simple/none"
+    )
 
 
 class XpidyConfig(BaseModel):
@@ -120,7 +182,7 @@ class XpidyConfig(BaseModel):
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "XpidyConfig":
         """从字典创建配置"""
-        return cls(**config_dict)
+        return cls.model_validate(config_dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -129,15 +191,11 @@ class XpidyConfig(BaseModel):
     @classmethod
     def load_from_file(cls, file_path: str) -> "XpidyConfig":
         """从文件加载配置"""
-        import json
-
         with open(file_path, "r", encoding="utf-8") as f:
             config_dict = json.load(f)
         return cls.from_dict(config_dict)
 
     def save_to_file(self, file_path: str):
         """保存配置到文件"""
-        import json
-
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
@@ -9,15 +9,54 @@ import re
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union
 
-import aiohttp
-from jinja2 import Template
+from jinja2 import Environment, Template
 from loguru import logger
 
 from ..utils.cache import CacheConfig, CacheManager
+from ..utils.json_utils import json_dumps, json_loads
+from ..utils.rate_limiter import TokenBucket
 from .config import LLMConfig
 
+# 单花括号形式的 {content} 占位符（不匹配 {{content}} 内部），编译前统一改写为 {{ content }}
+_SINGLE_BRACE_CONTENT_RE = re.compile(r"(?<!\{)\{content\}(?!\})")
+# 匹配 {{ content }} 内容占位符
+_CONTENT_PLACEHOLDER_RE = re.compile(r"\{\{\s*content\s*\}\}")
+
+
+class _ContentTemplate:
+    """仅含单个 content 占位符的模板，直接拼接字符串，跳过 Jinja2 渲染"""
+
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(self, prefix: str, suffix: str):
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def render(self, content: str = "", **_: Any) -> str:
+        return self.prefix + content + self.suffix
+
+    @classmethod
+    def from_source(cls, source: str) -> Optional["_ContentTemplate"]:
+        """模板只有一个 content 占位符且不含其他 Jinja2 语法时返回快速模板"""
+        parts = _CONTENT_PLACEHOLDER_RE.split(source)
+        if len(parts) != 2:
+            return None
+        if any(mark in part for part in parts for mark in ("{{", "{%", "{#")):
+            return None
+        return cls(*parts)
+
+
+def _compile_template(
+    env: Environment, source: str
+) -> Union[Template, _ContentTemplate]:
+    """编译提示词模板，简单模板走字符串拼接"""
+    # 先统一占位符写法，使 {content} 不论模板中是否含其他 Jinja2 语法都会被替换
+    source = _SINGLE_BRACE_CONTENT_RE.sub("{{ content }}", source)
+    return _ContentTemplate.from_source(source) or env.from_string(source)
+
 
 class LLMStats:
     """LLM调用统计"""
@@ -163,30 +202,96 @@ class BaseLLMClient(ABC):
     def __init__(self, config: LLMConfig):
         self.config = config
         self.rate_limiter = asyncio.Semaphore(config.max_concurrent_requests)
+        # 共享的HTTP连接池，整个客户端生命周期内复用连接
+        self._http = None
+
+    def _create_http_client(self):
+        """创建长连接复用的HTTP客户端，连接数与并发上限匹配"""
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.max_concurrent_requests * 2,
+                max_keepalive_connections=self.config.max_concurrent_requests,
+            ),
+            timeout=self.config.timeout,
+        )
+
+    async def aclose(self) -> None:
+        """关闭共享的HTTP连接池"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     @abstractmethod
     async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """生成文本"""
         pass
 
-    @abstractmethod
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """流式生成，逐段产出文本；默认实现一次性返回完整结果"""
+        yield await self.generate(prompt, system_prompt)
+
     async def generate_batch(
         self, prompts: List[str], system_prompt: Optional[str] = None
     ) -> List[str]:
-        """批量生成"""
-        pass
+        """批量生成
+
+        所有prompt同时提交，实际在途请求数由 rate_limiter
+        （max_concurrent_requests）限制，结果按输入顺序返回。
+        """
+        results = await asyncio.gather(
+            *(self.generate_with_retry(prompt, system_prompt) for prompt in prompts),
+            return_exceptions=True,
+        )
+
+        # 提取文本结果
+        text_results = []
+        for result in results:
+            if isinstance(result, Exception):
+                text_results.append(self._fallback_processing(str(result)))
+            elif isinstance(result, tuple):
+                # 从 (result, response_time, tokens, cost) 中提取结果
+                text_results.append(result[0])
+            else:
+                text_results.append(str(result))
+
+        return text_results
+
+    async def generate_batch_api(
+        self, prompts: List[str], system_prompt: Optional[str] = None
+    ) -> List[str]:
+        """通过提供商 Batch API 离线批量生成，不支持时退回并发调用"""
+        return await self.generate_batch(prompts, system_prompt)
+
+    async def _wait_for_batch(
+        self, retrieve, batch_id: str, status_field: str, done_statuses: set
+    ) -> Any:
+        """轮询批处理任务直至结束，轮询间隔从50ms指数增长至30秒"""
+        delay = 0.05
+        while True:
+            batch = await retrieve(batch_id)
+            if getattr(batch, status_field) in done_statuses:
+                return batch
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
 
     async def generate_with_retry(
         self, prompt: str, system_prompt: Optional[str] = None
     ) -> str:
         """带重试的生成"""
         last_exception = None
+        request_timeout = self.config.request_timeout or self.config.timeout
 
         for attempt in range(self.config.max_retries):
             try:
                 async with self.rate_limiter:
                     start_time = time.time()
-                    result = await self.generate(prompt, system_prompt)
+                    result = await asyncio.wait_for(
+                        self.generate(prompt, system_prompt), timeout=request_timeout
+                    )
                     response_time = time.time() - start_time
 
                     # 估算成本
@@ -197,9 +302,11 @@ class BaseLLMClient(ABC):
 
             except Exception as e:
                 last_exception = e
+                if not self._is_retryable(e):
+                    break
                 if attempt < self.config.max_retries - 1:
                     # 指数退避
-                    wait_time = min(2**attempt * self.config.request_interval, 60)
+                    wait_time = min(2**attempt * self.config.retry_delay, 60)
                     logger.warning(
                         f"LLM调用失败，{wait_time:.1f}秒后重试 (尝试 {attempt + 1}/{self.config.max_retries}): {e}"
                     )
@@ -212,6 +319,16 @@ class BaseLLMClient(ABC):
         fallback_result = self._fallback_processing(prompt)
         return fallback_result, 0.0, 0, 0.0
 
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """判断错误是否值得重试：超时、连接错误、429 和 5xx 重试，其余 4xx 不重试"""
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int) and 400 <= status_code < 500:
+            return status_code in (408, 409, 429)
+        return True
+
     def _fallback_processing(self, prompt: str) -> str:
         """降级处理"""
         if self.config.fallback_strategy == "original":
@@ -246,22 +363,34 @@ class OpenAIClient(BaseLLMClient):
         try:
             import openai
 
+            self._http = self._create_http_client()
             self.client = openai.AsyncOpenAI(
-                api_key=config.api_key, base_url=config.base_url
+                api_key=config.api_key, base_url=config.base_url, http_client=self._http
             )
         except ImportError:
             raise ImportError("需要安装 openai 包: uv add openai")
 
-    async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """生成文本"""
-        messages = []
+        # 预先构建默认系统消息，避免每次调用重复构建
+        self._default_system_msgs = (
+            ({"role": "system", "content": config.system_prompt},)
+            if config.system_prompt
+            else ()
+        )
 
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        elif self.config.system_prompt:
-            messages.append({"role": "system", "content": self.config.system_prompt})
+    def _build_messages(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """构建对话消息列表"""
+        system_msgs = (
+            ({"role": "system", "content": system_prompt},)
+            if system_prompt
+            else self._default_system_msgs
+        )
+        return [*system_msgs, {"role": "user", "content": prompt}]
 
-        messages.append({"role": "user", "content": prompt})
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """生成文本"""
+        messages = self._build_messages(prompt, system_prompt)
 
         try:
             response = await self.client.chat.completions.create(
@@ -279,31 +408,87 @@ class OpenAIClient(BaseLLMClient):
             logger.error(f"OpenAI API 调用失败: {e}")
             raise
 
-    async def generate_batch(
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """流式生成文本"""
+        stream = await self.client.chat.completions.create(
+            model=self.config.model,
+            messages=self._build_messages(prompt, system_prompt),
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            top_p=self.config.top_p,
+            timeout=self.config.timeout,
+            stream=True,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # 调用方提前停止迭代时关闭连接，终止服务端生成
+            await stream.close()
+
+    async def generate_batch_api(
         self, prompts: List[str], system_prompt: Optional[str] = None
     ) -> List[str]:
-        """批量生成"""
-        # 使用重试机制处理每个prompt
-        tasks = []
-        for prompt in prompts:
-            task = self.generate_with_retry(prompt, system_prompt)
-            tasks.append(task)
+        """通过 OpenAI Batch API 批量生成"""
+        body = {
+            "model": self.config.model,
+            "temperature": self.config.temperature,
+            "top_p": self.config.top_p,
+        }
+        if self.config.max_tokens:
+            body["max_tokens"] = self.config.max_tokens
+
+        lines = [
+            json_dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        **body,
+                        "messages": self._build_messages(prompt, system_prompt),
+                    },
+                }
+            )
+            for i, prompt in enumerate(prompts)
+        ]
 
-        # 执行所有任务
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        input_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"已提交 OpenAI 批处理任务 {batch.id}，共 {len(prompts)} 项")
 
-        # 提取文本结果
-        text_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                text_results.append(self._fallback_processing(str(result)))
-            elif isinstance(result, tuple):
-                # 从 (result, response_time, tokens, cost) 中提取结果
-                text_results.append(result[0])
-            else:
-                text_results.append(str(result))
+        batch = await self._wait_for_batch(
+            self.client.batches.retrieve,
+            batch.id,
+            "status",
+            {"completed", "failed", "expired", "cancelled"},
+        )
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI 批处理任务 {batch.id} 未完成: {batch.status}")
 
-        return text_results
+        results: List[Optional[str]] = [None] * len(prompts)
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            item = json_loads(line)
+            choices = ((item.get("response") or {}).get("body") or {}).get("choices")
+            if choices:
+                results[int(item["custom_id"])] = choices[0]["message"]["content"] or ""
+
+        return [
+            result if result is not None else self._fallback_processing(prompt)
+            for result, prompt in zip(results, prompts)
+        ]
 
 
 class AnthropicClient(BaseLLMClient):
@@ -314,16 +499,19 @@ class AnthropicClient(BaseLLMClient):
         try:
             import anthropic
 
+            self._http = self._create_http_client()
             self.client = anthropic.AsyncAnthropic(
-                api_key=config.api_key, base_url=config.base_url
+                api_key=config.api_key, base_url=config.base_url, http_client=self._http
             )
         except ImportError:
             raise ImportError("需要安装 anthropic 包: pip install anthropic")
 
+        self._default_system = config.system_prompt or ""
+
     async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """生成文本"""
         try:
-            system = system_prompt or self.config.system_prompt or ""
+            system = system_prompt or self._default_system
 
             response = await self.client.messages.create(
                 model=self.config.model,
@@ -341,36 +529,74 @@ class AnthropicClient(BaseLLMClient):
             logger.error(f"Anthropic API 调用失败: {e}")
             raise
 
-    async def generate_batch(
+    async def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """流式生成文本"""
+        async with self.client.messages.stream(
+            model=self.config.model,
+            max_tokens=self.config.max_tokens or 1000,
+            temperature=self.config.temperature,
+            top_p=self.config.top_p,
+            system=system_prompt or self._default_system,
+            messages=[{"role": "user", "content": prompt}],
+            timeout=self.config.timeout,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    async def generate_batch_api(
         self, prompts: List[str], system_prompt: Optional[str] = None
     ) -> List[str]:
-        """批量生成"""
-        # 使用重试机制处理每个prompt
-        tasks = []
-        for prompt in prompts:
-            task = self.generate_with_retry(prompt, system_prompt)
-            tasks.append(task)
+        """通过 Anthropic Message Batches API 批量生成"""
+        params = {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens or 1000,
+            "temperature": self.config.temperature,
+            "top_p": self.config.top_p,
+            "system": system_prompt or self._default_system,
+        }
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": str(i),
+                    "params": {
+                        **params,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+        )
+        logger.info(f"已提交 Anthropic 批处理任务 {batch.id}，共 {len(prompts)} 项")
 
-        # 执行所有任务
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._wait_for_batch(
+            self.client.messages.batches.retrieve,
+            batch.id,
+            "processing_status",
+            {"ended"},
+        )
 
-        # 提取文本结果
-        text_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                text_results.append(self._fallback_processing(str(result)))
-            elif isinstance(result, tuple):
-                # 从 (result, response_time, tokens, cost) 中提取结果
-                text_results.append(result[0])
-            else:
-                text_results.append(str(result))
+        results: List[Optional[str]] = [None] * len(prompts)
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                results[int(entry.custom_id)] = (
+                    message.content[0].text if message.content else ""
+                )
 
-        return text_results
+        return [
+            result if result is not None else self._fallback_processing(prompt)
+            for result, prompt in zip(results, prompts)
+        ]
 
 
 class LLMProcessor:
     """LLM 数据处理器"""
 
+    # 编译后模板缓存的最大数量
+    TEMPLATE_CACHE_SIZE = 256
+
     # 增强的内置提示词模板
     BUILT_IN_PROMPTS = {
         "extract_text": """
@@ -454,6 +680,21 @@ JSON结果：
         """.strip(),
     }
 
+    # 共享的模板环境，内置提示词在类加载时预编译
+    _ENV = Environment(auto_reload=False, cache_size=-1)
+    BUILT_IN_COMPILED: Dict[str, Union[Template, _ContentTemplate]] = dict(
+        zip(
+            BUILT_IN_PROMPTS,
+            map(partial(_compile_template, _ENV), BUILT_IN_PROMPTS.values()),
+        )
+    )
+
+    # 提供商名称到客户端类的映射，可通过 register_client 扩展
+    CLIENT_REGISTRY: Dict[str, Type[BaseLLMClient]] = {
+        "openai": OpenAIClient,
+        "anthropic": AnthropicClient,
+    }
+
     def __init__(self, config: LLMConfig):
         self.config = config
         self.client = self._create_client()
@@ -461,6 +702,14 @@ JSON结果：
         # 合并内置和自定义提示词
         self.prompts = {**self.BUILT_IN_PROMPTS, **config.custom_prompts}
 
+        # 编译后模板缓存（按模板源码缓存），内置模板复用预编译结果
+        self._template_cache: Dict[str, Union[Template, _ContentTemplate]] = {
+            self.BUILT_IN_PROMPTS[name]: template
+            for name, template in self.BUILT_IN_COMPILED.items()
+        }
+        for source in config.custom_prompts.values():
+            self._get_template(source)
+
         # 初始化缓存
         self.cache = None
         if config.enable_cache:
@@ -476,14 +725,62 @@ JSON结果：
         # 初始化统计
         self.stats = LLMStats() if config.enable_stats else None
 
+        # 请求限流（未设置时使用固定的批处理延迟）
+        self._bucket = None
+        if config.requests_per_minute:
+            rpm = config.requests_per_minute
+            self._bucket = TokenBucket(rate=rpm / 60, capacity=rpm)
+
+        # 自适应批大小：按批次耗时的指数滑动平均在 [1, max_batch_size] 内调整
+        self._current_batch_size = config.batch_size
+        self._ewma_latency: Optional[float] = None
+
+    def _adapt_batch_size(self, batch_len: int, elapsed: float) -> None:
+        """根据批次耗时调整后续批大小：明显快于目标时扩大25%，慢于目标时缩小25%"""
+        if not self.config.adaptive_batch_size:
+            return
+
+        if self._ewma_latency is None:
+            self._ewma_latency = elapsed
+        else:
+            self._ewma_latency = 0.3 * elapsed + 0.7 * self._ewma_latency
+
+        target = self.config.target_item_latency * batch_len
+        if self._ewma_latency < target * 0.8:
+            new_size = max(self._current_batch_size + 1, int(batch_len * 1.25))
+        elif self._ewma_latency > target * 1.2:
+            new_size = int(batch_len * 0.75)
+        else:
+            return
+
+        new_size = max(1, min(self.config.max_batch_size, new_size))
+        if new_size != self._current_batch_size:
+            logger.debug(f"批大小调整: {self._current_batch_size} -> {new_size}")
+            self._current_batch_size = new_size
+
+    def _get_template(self, source: str) -> Union[Template, _ContentTemplate]:
+        """获取编译后的模板"""
+        template = self._template_cache.get(source)
+        if template is None:
+            if len(self._template_cache) >= self.TEMPLATE_CACHE_SIZE:
+                # 淘汰最早加入的模板
+                self._template_cache.pop(next(iter(self._template_cache)))
+            template = _compile_template(self._ENV, source)
+            self._template_cache[source] = template
+        return template
+
     def _create_client(self) -> BaseLLMClient:
         """创建 LLM 客户端"""
-        if self.config.provider == "openai":
-            return OpenAIClient(self.config)
-        elif self.config.provider == "anthropic":
-            return AnthropicClient(self.config)
-        else:
+        client_cls = self.CLIENT_REGISTRY.get(self.config.provider)
+        if client_cls is None:
             raise ValueError(f"不支持的 LLM 提供商: {self.config.provider}")
+        return client_cls(self.config)
+
+    @classmethod
+    def register_client(cls, provider: str, client_cls: Type[BaseLLMClient]) -> None:
+        """注册自定义 LLM 提供商客户端"""
+        cls.CLIENT_REGISTRY[provider] = client_cls
+        logger.info(f"注册 LLM 提供商: {provider}")
 
     async def process(
         self,
@@ -495,7 +792,9 @@ JSON结果：
         """处理单个内容"""
         try:
             # 检查每日成本限制
-            if self.stats and self.stats.check_daily_limit(self.config.max_daily_cost):
+            if self.stats and self.stats.check_daily_limit(
+                self.config.daily_cost_limit
+            ):
                 logger.warning("已达到每日成本限制，使用降级策略")
                 return self.client._fallback_processing(content)
 
@@ -526,7 +825,7 @@ JSON结果：
                     return cached_result
 
             # 渲染提示词模板
-            template = Template(prompt_template)
+            template = self._get_template(prompt_template)
             prompt = template.render(content=processed_content, **template_vars)
 
             # 调用 LLM
@@ -556,6 +855,30 @@ JSON结果：
                 await self.stats.record_api_call(0, 0, 0, success=False)
             raise
 
+    async def process_stream(
+        self,
+        content: str,
+        prompt_name: str = "extract_text",
+        custom_prompt: Optional[str] = None,
+        **template_vars,
+    ) -> AsyncIterator[str]:
+        """流式处理单个内容，边生成边产出文本片段（不经过缓存与重试）"""
+        if custom_prompt:
+            prompt_template = custom_prompt
+        elif prompt_name in self.prompts:
+            prompt_template = self.prompts[prompt_name]
+        else:
+            raise ValueError(f"未找到提示词: {prompt_name}")
+
+        processed_content = await self._preprocess_content(content)
+        prompt = self._get_template(prompt_template).render(
+            content=processed_content, **template_vars
+        )
+
+        async with self.client.rate_limiter:
+            async for chunk in self.client.generate_stream(prompt):
+                yield chunk
+
     async def process_batch(
         self,
         contents: List[str],
@@ -576,8 +899,8 @@ JSON结果：
             else:
                 raise ValueError(f"未找到提示词: {prompt_name}")
 
-            # 预编译模板
-            template = Template(prompt_template)
+            # 获取编译后的模板
+            template = self._get_template(prompt_template)
 
             # 预处理所有内容
             processed_contents = []
@@ -611,14 +934,40 @@ JSON结果：
             for i, result in cached_results.items():
                 results[i] = result
 
-            if uncached_indices:
+            threshold = self.config.batch_api_threshold
+            if threshold and len(uncached_indices) >= threshold:
+                # 数量足够时走提供商 Batch API，一次提交全部未缓存内容
+                prompts = [
+                    template.render(content=processed_contents[i], **template_vars)
+                    for i in uncached_indices
+                ]
+                batch_results = await self.client.generate_batch_api(prompts)
+
+                for original_index, result in zip(uncached_indices, batch_results):
+                    results[original_index] = result
+                    if self.cache and cache_keys[original_index] and result:
+                        await self.cache.set(cache_keys[original_index], result)
+
+            elif uncached_indices:
+                # 按内容长度排序后分批，让同一批次的请求长度相近，减少长请求拖慢整批；
+                # 结果按原始下标回填，返回顺序不变
+                uncached_indices.sort(key=lambda i: len(processed_contents[i]))
+
                 # 分批处理未缓存的内容
-                batch_size = self.config.batch_size
+                batch_start = 0
 
-                for batch_start in range(0, len(uncached_indices), batch_size):
+                while batch_start < len(uncached_indices):
+                    batch_size = self._current_batch_size
                     batch_indices = uncached_indices[
                         batch_start : batch_start + batch_size
                     ]
+                    batch_start += batch_size
+
+                    # 按令牌桶限流，预算充足时立即发出
+                    if self._bucket:
+                        await self._bucket.acquire(
+                            min(len(batch_indices), self._bucket.capacity)
+                        )
 
                     # 渲染提示词
                     prompts = []
@@ -629,7 +978,11 @@ JSON结果：
                         prompts.append(prompt)
 
                     # 批量调用 LLM
+                    batch_begin = time.perf_counter()
                     batch_results = await self.client.generate_batch(prompts)
+                    self._adapt_batch_size(
+                        len(prompts), time.perf_counter() - batch_begin
+                    )
 
                     # 处理结果
                     for j, result in enumerate(batch_results):
@@ -647,9 +1000,9 @@ JSON结果：
                         if self.cache and cache_keys[original_index] and result:
                             await self.cache.set(cache_keys[original_index], result)
 
-                    # 智能延迟
-                    if batch_start + batch_size < len(uncached_indices):
-                        await asyncio.sleep(self.config.request_interval)
+                    # 未配置限流时使用固定批处理延迟
+                    if not self._bucket and batch_start < len(uncached_indices):
+                        await asyncio.sleep(self.config.batch_delay)
 
             logger.info(
                 f"批量 LLM 处理完成，处理了 {len(contents)} 个内容，缓存命中 {len(cached_results)} 个"
@@ -670,7 +1023,7 @@ JSON结果：
                 if custom_prompt:
                     prompt_template = custom_prompt
                 else:
-                    schema_str = json.dumps(schema, ensure_ascii=False, indent=2)
+                    schema_str = json_dumps(schema, indent=True)
                     prompt_template = self.prompts["extract_structured_data"].format(
                         schema=schema_str
                     )
@@ -723,8 +1076,9 @@ JSON结果：
     def _robust_json_parse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
         """鲁棒的JSON解析"""
         # 1. 直接解析
+        # orjson.JSONDecodeError 为 json.JSONDecodeError 子类，以下异常处理对两者通用
         try:
-            parsed = json.loads(text.strip())
+            parsed = json_loads(text.strip())
             if self._validate_schema_structure(parsed, schema):
                 return parsed
         except json.JSONDecodeError:
@@ -736,17 +1090,16 @@ JSON结果：
         )
         for block in json_blocks:
             try:
-                parsed = json.loads(block)
+                parsed = json_loads(block)
                 if self._validate_schema_structure(parsed, schema):
                     return parsed
             except json.JSONDecodeError:
                 continue
 
-        # 3. 更智能的正则匹配
-        json_matches = re.findall(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", text)
-        for match in json_matches:
+        # 3. 按括号配对扫描，支持任意嵌套层级
+        for match in self._iter_json_objects(text):
             try:
-                parsed = json.loads(match)
+                parsed = json_loads(match)
                 if self._validate_schema_structure(parsed, schema):
                     return parsed
             except json.JSONDecodeError:
@@ -755,6 +1108,33 @@ JSON结果：
         # 4. 尝试修复常见JSON错误
         return self._attempt_json_repair(text, schema)
 
+    @staticmethod
+    def _iter_json_objects(text: str):
+        """线性扫描文本，逐个产出括号配对的顶层 {...} 片段（忽略字符串内的括号）"""
+        depth = 0
+        start = 0
+        in_string = False
+        escaped = False
+
+        for i, char in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = depth > 0
+            elif char == "{":
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif char == "}" and depth:
+                depth -= 1
+                if depth == 0:
+                    yield text[start : i + 1]
+
     def _validate_schema_structure(
         self, data: Dict[str, Any], schema: Dict[str, Any]
     ) -> bool:
@@ -776,8 +1156,9 @@ JSON结果：
         """尝试修复JSON"""
         try:
             # 尝试修复常见问题：
-            # 1. 移除多余的文本
-            cleaned = re.sub(r"^[^{]*(\{.*\})[^}]*$", r"\1", text, flags=re.DOTALL)
+            # 1. 移除首个 { 之前与最后一个 } 之后的多余文本
+            start, end = text.find("{"), text.rfind("}")
+            cleaned = text[start : end + 1] if 0 <= start < end else text
 
             # 2. 修复未闭合的引号
             cleaned = re.sub(r'(["\'])\s*\n\s*(["\'])', r"\1, \2", cleaned)
@@ -786,7 +1167,7 @@ JSON结果：
             cleaned = re.sub(r",\s*}", "}", cleaned)
             cleaned = re.sub(r",\s*]", "]", cleaned)
 
-            return json.loads(cleaned)
+            return json_loads(cleaned)
         except:
             # 修复失败，返回基础结构
             return self._create_fallback_json(schema)
@@ -830,6 +1211,7 @@ JSON结果：
     def add_custom_prompt(self, name: str, template: str) -> None:
         """添加自定义提示词"""
         self.prompts[name] = template
+        self._get_template(template)
         logger.info(f"添加自定义提示词: {name}")
 
     def get_available_prompts(self) -> List[str]:
@@ -842,6 +1224,10 @@ JSON结果：
             return self.stats.get_stats()
         return {}
 
+    async def close(self) -> None:
+        """释放客户端持有的HTTP连接"""
+        await self.client.aclose()
+
     async def cleanup_cache(self) -> None:
         """清理过期缓存"""
         if self.cache:
@@ -3,8 +3,20 @@ Xpidy 核心爬虫类
 """
 
 import asyncio
+import copy
+import os
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 from loguru import logger
 from playwright.async_api import (
@@ -14,8 +26,12 @@ from playwright.async_api import (
     Playwright,
     async_playwright,
 )
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ..extractors import (
+    FormExtractor,
+    FormExtractorConfig,
     ImageExtractor,
     ImageExtractorConfig,
     LinkExtractor,
@@ -23,8 +39,161 @@ from ..extractors import (
     TextExtractor,
     TextExtractorConfig,
 )
+from ..utils.cache import CacheConfig, CacheManager
+from ..utils.retry import RetryConfig, RetryManager, RetryStrategy
 from .config import ExtractionConfig, LLMConfig, SpiderConfig, XpidyConfig
 
+# 可重试的瞬时网络错误；DNS解析失败、无效URL等错误重试无益，直接抛出
+_TRANSIENT_NET_ERRORS = (
+    "net::ERR_CONNECTION_RESET",
+    "net::ERR_CONNECTION_REFUSED",
+    "net::ERR_CONNECTION_CLOSED",
+    "net::ERR_CONNECTION_TIMED_OUT",
+    "net::ERR_TIMED_OUT",
+    "net::ERR_EMPTY_RESPONSE",
+    "net::ERR_NETWORK_CHANGED",
+)
+
+
+def _is_transient_navigation_error(error: Exception) -> bool:
+    """判断页面导航错误是否为可重试的超时或瞬时网络错误"""
+    if isinstance(error, PlaywrightTimeoutError):
+        return True
+    message = str(error)
+    return any(code in message for code in _TRANSIENT_NET_ERRORS)
+
+
+class _BrowserPool:
+    """进程内共享的浏览器池
+
+    同一事件循环中的多个 Spider 共享一个 Playwright 实例，并按 headless 参数复用浏览器，
+    最后一个使用者释放后按 idle_timeout 延迟关闭，相邻的 ``async with Spider(...)``
+    因此无需重复冷启动浏览器。
+    """
+
+    # 事件循环关闭时清理浏览器的最长等待时间（秒）
+    SHUTDOWN_TIMEOUT = 2.0
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._playwright: Optional[Playwright] = None
+        self._browsers: Dict[bool, Browser] = {}
+        self._refcount = 0
+        self._close_task: Optional[asyncio.Task] = None
+
+    def _bind_loop(self):
+        """绑定当前事件循环，旧循环上的资源无法跨循环复用"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._playwright = None
+            self._browsers = {}
+            self._refcount = 0
+            self._close_task = None
+
+    async def acquire(self, headless: bool) -> Tuple[Playwright, Browser]:
+        """获取共享的Playwright和浏览器"""
+        self._bind_loop()
+        async with self._lock:
+            # 取消挂起的延迟关闭
+            if self._close_task:
+                close_task, self._close_task = self._close_task, None
+                close_task.cancel()
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                browser = await self._playwright.chromium.launch(headless=headless)
+                self._browsers[headless] = browser
+            else:
+                logger.debug("复用已启动的浏览器")
+
+            self._refcount += 1
+            return self._playwright, browser
+
+    async def release(self, idle_timeout: float = 0.0):
+        """释放引用，最后一个使用者释放后关闭（或延迟关闭）浏览器"""
+        async with self._lock:
+            self._refcount = max(self._refcount - 1, 0)
+            if self._refcount > 0:
+                return
+
+            if idle_timeout > 0:
+                self._close_task = asyncio.create_task(
+                    self._close_when_idle(idle_timeout), name="browser_pool_idle_close"
+                )
+            else:
+                await self._close_all()
+
+    async def _close_when_idle(self, idle_timeout: float):
+        """空闲超时后关闭浏览器"""
+        try:
+            await asyncio.sleep(idle_timeout)
+        except asyncio.CancelledError:
+            # 被新的 acquire 取消时保留浏览器；事件循环关闭时尽力清理
+            if self._close_task is asyncio.current_task():
+                try:
+                    await asyncio.wait_for(self._close_all(), self.SHUTDOWN_TIMEOUT)
+                except (Exception, asyncio.CancelledError):
+                    pass
+            raise
+
+        async with self._lock:
+            if self._refcount == 0 and self._close_task is asyncio.current_task():
+                self._close_task = None
+                await self._close_all()
+
+    async def _close_all(self):
+        """关闭所有浏览器并停止Playwright"""
+        browsers, self._browsers = self._browsers, {}
+        playwright, self._playwright = self._playwright, None
+
+        for browser in browsers.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"关闭浏览器时出错: {e}")
+        logger.debug("浏览器已关闭")
+
+        if playwright:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.warning(f"停止Playwright时出错: {e}")
+            logger.debug("Playwright已停止")
+
+
+_browser_pool = _BrowserPool()
+
+
+class _AdmissionGate:
+    """并发准入闸门，与 Semaphore 不同，上限可在运行中安全调整"""
+
+    def __init__(self, limit: int):
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self.limit = max(1, limit)
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int):
+        """调整并发上限，调大时立即唤醒等待者，调小时在途任务完成后生效"""
+        async with self._cond:
+            self.limit = max(1, limit)
+            self._cond.notify_all()
+
 
 class Spider:
     """核心爬虫类"""
@@ -34,12 +203,51 @@ class Spider:
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        # 并发爬取复用的空闲上下文及各上下文已承载的页面数
+        self._context_pool: List[BrowserContext] = []
+        self._context_uses: Dict[BrowserContext, int] = {}
+        # 启用页面复用时，各空闲上下文保留的页面
+        self._idle_pages: Dict[BrowserContext, Page] = {}
+        # 防止并发启动时重复获取浏览器和创建上下文
+        self._start_lock = asyncio.Lock()
+        # 正在进行的 crawl_multiple_urls_iter 的并发闸门
+        self._admission_gate: Optional[_AdmissionGate] = None
         self._extractors: Dict[str, Any] = {}
         self._extraction_results: Dict[str, Any] = {}
         self._llm_processor = None
+        self._result_cache: Optional[CacheManager] = None
+        # 启用 retry_navigation 时，页面导航遇到超时或瞬时网络错误按去相关抖动退避重试，
+        # 错开并发任务的重试时间；全部尝试与等待的总耗时不超过页面超时时间
+        spider_config = config.spider_config
+        self._nav_retry = RetryManager(
+            RetryConfig(
+                max_attempts=(
+                    spider_config.retry_times + 1
+                    if spider_config.retry_navigation
+                    else 1
+                ),
+                strategy=RetryStrategy.DECORRELATED,
+                base_delay=spider_config.retry_delay,
+                max_delay=10.0,
+                max_total_time=spider_config.timeout / 1000,
+                jitter=False,
+                retry_on_exceptions=[PlaywrightError],
+                retry_if=_is_transient_navigation_error,
+            )
+        )
 
         # 初始化提取器
         self._init_extractors()
+        # 提取器在初始化后不再变化，缓存名称列表和绑定好的 extract 方法供每次爬取复用
+        self._extractor_names: Tuple[str, ...] = tuple(self._extractors)
+        self._extract_plan: Tuple[
+            Tuple[str, Callable[[Page], Awaitable[Dict[str, Any]]]], ...
+        ] = tuple(
+            (name, extractor.extract) for name, extractor in self._extractors.items()
+        )
+
+        # 初始化结果缓存（通过 XPIDY_CACHE 环境变量指定缓存目录后启用）
+        self._init_result_cache()
 
         # 初始化LLM处理器
         if self.config.llm_config.enabled:
@@ -81,8 +289,6 @@ class Spider:
 
         # 表单提取器（新增）
         if extraction_config.enable_form:
-            from ..extractors.form_extractor import FormExtractor, FormExtractorConfig
-
             form_config = self._merge_extractor_config(
                 FormExtractorConfig(), extraction_config.form_config
             )
@@ -100,19 +306,69 @@ class Spider:
             self.config.extraction_config.global_exclude_selectors
         )
 
+        # 在副本上合并，避免重复创建Spider时全局选择器被反复追加到用户配置
+        merged = dict(user_config)
         if global_selectors:
-            user_config.setdefault("selectors", []).extend(global_selectors)
+            merged["selectors"] = [*(merged.get("selectors") or []), *global_selectors]
         if global_xpath_selectors:
-            user_config.setdefault("xpath_selectors", []).extend(global_xpath_selectors)
+            merged["xpath_selectors"] = [
+                *(merged.get("xpath_selectors") or []),
+                *global_xpath_selectors,
+            ]
         if global_exclude_selectors:
-            user_config.setdefault("exclude_selectors", []).extend(
-                global_exclude_selectors
+            merged["exclude_selectors"] = [
+                *(merged.get("exclude_selectors") or []),
+                *global_exclude_selectors,
+            ]
+
+        # 只取基础配置中显式设置的字段，其余由模型默认值补齐，一次校验构建
+        return type(base_config).model_validate(
+            {**base_config.model_dump(exclude_unset=True), **merged}
+        )
+
+    def _init_result_cache(self):
+        """初始化爬取结果缓存"""
+        cache_dir = os.environ.get("XPIDY_CACHE")
+        if not cache_dir or not self.config.spider_config.enable_cache:
+            return
+
+        self._result_cache = CacheManager(
+            CacheConfig(
+                cache_dir=cache_dir,
+                default_ttl=self.config.spider_config.cache_ttl,
             )
+        )
+        # 提取配置不同则结果不同，作为缓存键的一部分
+        self._cache_fingerprint = self.config.extraction_config.model_dump_json()
+        logger.info(f"爬取结果缓存已启用: {cache_dir}")
+
+    def _get_cache_key(self, url: str, prompt: Optional[str]) -> str:
+        """生成爬取结果缓存键"""
+        return f"{url}|{prompt or ''}|{self._cache_fingerprint}"
+
+    async def _get_cached_result(
+        self, url: str, prompt: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """读取缓存的爬取结果"""
+        if not self._result_cache:
+            return None
 
-        # 更新配置
-        config_dict = base_config.model_dump()
-        config_dict.update(user_config)
-        return base_config.__class__(**config_dict)
+        cached = await self._result_cache.get(self._get_cache_key(url, prompt))
+        if cached is None:
+            return None
+
+        logger.info(f"命中爬取缓存: {url}")
+        # 内存缓存返回的是同一对象，复制后交给调用方，避免修改相互影响
+        return copy.deepcopy(cached)
+
+    async def _cache_result(
+        self, url: str, prompt: Optional[str], result: Dict[str, Any]
+    ):
+        """缓存成功的爬取结果（存入副本，调用方后续修改结果不影响缓存）"""
+        if self._result_cache and "error" not in result:
+            await self._result_cache.set(
+                self._get_cache_key(url, prompt), copy.deepcopy(result)
+            )
 
     def _init_llm_processor(self):
         """初始化LLM处理器"""
@@ -130,42 +386,69 @@ class Spider:
         await self._close_browser()
 
     async def _start_browser(self):
-        """启动浏览器"""
-        try:
-            # 启动playwright
-            self.playwright = await async_playwright().start()
+        """启动浏览器（已启动时直接返回）"""
+        if self.context:
+            return
 
-            # 启动浏览器
-            self.browser = await self.playwright.chromium.launch(
+        async with self._start_lock:
+            if self.context:
+                return
+            await self._start_browser_locked()
+
+    async def _start_browser_locked(self):
+        """在启动锁内获取浏览器并创建上下文"""
+        try:
+            # 从共享池获取playwright和浏览器
+            self.playwright, self.browser = await _browser_pool.acquire(
                 headless=self.config.spider_config.headless
             )
 
             # 创建上下文
-            context_options = {
-                "viewport": self.config.spider_config.viewport,
-                "user_agent": self.config.spider_config.user_agent,
-            }
-
-            # 过滤None值
-            context_options = {
-                k: v for k, v in context_options.items() if v is not None
-            }
-
-            self.context = await self.browser.new_context(**context_options)
-
-            # 配置超时
-            self.context.set_default_timeout(self.config.spider_config.timeout)
+            self.context = await self._new_context()
 
             logger.info("浏览器启动成功")
 
         except Exception as e:
             logger.error(f"浏览器启动失败: {e}")
+            await self._close_browser()
             raise
 
+    async def _new_context(self, ignore_https_errors: bool = False) -> BrowserContext:
+        """
+        按爬虫配置创建浏览器上下文，主上下文与并发爬取的上下文池共用
+
+        Args:
+            ignore_https_errors: 是否忽略HTTPS证书错误（批量爬取沿用原有行为，开启）
+        """
+        context_options = {
+            "viewport": self.config.spider_config.viewport,
+            "user_agent": self.config.spider_config.user_agent,
+            "ignore_https_errors": ignore_https_errors,
+        }
+
+        # 过滤None值
+        context_options = {k: v for k, v in context_options.items() if v is not None}
+
+        context = await self.browser.new_context(**context_options)
+
+        # 配置超时
+        context.set_default_timeout(self.config.spider_config.timeout)
+        return context
+
     async def _close_browser(self):
         """关闭浏览器"""
         try:
-            # 按正确顺序关闭：页面 -> 上下文 -> 浏览器 -> playwright
+            # 关闭上下文池中的空闲上下文
+            while self._context_pool:
+                context = self._context_pool.pop()
+                self._context_uses.pop(context, None)
+                self._idle_pages.pop(context, None)
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+            # 按正确顺序关闭：页面 -> 上下文 -> 释放共享浏览器
             if self.context:
                 # 关闭所有页面
                 for page in self.context.pages:
@@ -180,14 +463,11 @@ class Spider:
                 logger.debug("浏览器上下文已关闭")
 
             if self.browser:
-                await self.browser.close()
                 self.browser = None
-                logger.debug("浏览器已关闭")
-
-            if self.playwright:
-                await self.playwright.stop()
                 self.playwright = None
-                logger.debug("Playwright已停止")
+                await _browser_pool.release(
+                    self.config.spider_config.browser_idle_timeout
+                )
 
             logger.info("浏览器资源已完全清理")
 
@@ -210,6 +490,11 @@ class Spider:
                 "Spider未初始化，请使用 async with Spider(...) as spider:"
             )
 
+        cached_result = await self._get_cached_result(url, prompt)
+        if cached_result is not None:
+            self._extraction_results.update(cached_result.get("results", {}))
+            return cached_result
+
         logger.info(f"开始爬取: {url}")
         start_time = time.time()
 
@@ -218,44 +503,20 @@ class Spider:
 
         try:
             # 访问页面
-            await page.goto(url, wait_until="domcontentloaded")
-            await page.wait_for_load_state("networkidle")
+            await self._navigate(page, url)
 
-            # 并发执行所有提取器
-            extraction_tasks = []
-            for name, extractor in self._extractors.items():
-                task = asyncio.create_task(
-                    self._safe_extract(name, extractor, page), name=f"extract_{name}"
-                )
-                extraction_tasks.append(task)
-
-            # 等待所有提取任务完成
-            if extraction_tasks:
-                extraction_results = await asyncio.gather(
-                    *extraction_tasks, return_exceptions=True
-                )
-
-                # 处理提取结果
-                for i, (name, result) in enumerate(
-                    zip(self._extractors.keys(), extraction_results)
-                ):
-                    if isinstance(result, Exception):
-                        logger.error(f"提取器 {name} 执行失败: {result}")
-                        self._extraction_results[name] = {"error": str(result)}
-                    else:
-                        self._extraction_results[name] = result
-                        logger.info(
-                            f"提取器 {name} 完成，提取到 {self._get_result_count(result)} 项"
-                        )
+            # 并发执行所有提取器，每次爬取使用独立的结果字典
+            extraction_results_by_name = await self._run_extractors(page)
 
             # 构建最终结果
             final_result = {
                 "url": url,
                 "timestamp": time.time(),
                 "extraction_time": time.time() - start_time,
-                "extractors_used": list(self._extractors.keys()),
-                "results": self._extraction_results.copy(),
+                "extractors_used": list(self._extractor_names),
+                "results": extraction_results_by_name,
             }
+            self._extraction_results = extraction_results_by_name
 
             # LLM后处理
             if prompt and self._llm_processor:
@@ -272,6 +533,7 @@ class Spider:
             logger.info(
                 f"爬取完成: {url}, 耗时: {final_result['extraction_time']:.2f}秒"
             )
+            await self._cache_result(url, prompt, final_result)
             return final_result
 
         except Exception as e:
@@ -312,14 +574,16 @@ class Spider:
         if prompts and len(prompts) != len(urls):
             raise ValueError("prompts数量必须与urls数量相等或为None")
 
-        logger.info(f"开始并发爬取 {len(urls)} 个URL，最大并发数: {max_concurrent}")
+        total_urls = len(urls)
+        logger.info(f"开始并发爬取 {total_urls} 个URL，最大并发数: {max_concurrent}")
 
         # 分批处理URLs
         results = []
+        success_count = 0
         total_start_time = time.time()
 
-        for batch_start in range(0, len(urls), max_concurrent):
-            batch_end = min(batch_start + max_concurrent, len(urls))
+        for batch_start in range(0, total_urls, max_concurrent):
+            batch_end = min(batch_start + max_concurrent, total_urls)
             batch_urls = urls[batch_start:batch_end]
             batch_prompts = (
                 prompts[batch_start:batch_end] if prompts else [None] * len(batch_urls)
@@ -357,100 +621,143 @@ class Spider:
                 else:
                     result["batch_index"] = batch_start + i + 1
                     results.append(result)
+                    success_count += "error" not in result
 
             # 批次间延迟（避免过于频繁的请求）
-            if batch_end < len(urls):
+            if batch_end < total_urls:
                 logger.debug(f"批次间延迟 {delay_between_batches} 秒")
                 await asyncio.sleep(delay_between_batches)
 
         total_time = time.time() - total_start_time
-        success_count = len([r for r in results if "error" not in r])
 
         logger.info(
-            f"并发爬取完成: {success_count}/{len(urls)} 成功, "
+            f"并发爬取完成: {success_count}/{total_urls} 成功, "
             f"总耗时: {total_time:.2f}秒, "
-            f"平均耗时: {total_time/len(urls):.2f}秒/URL"
+            f"平均耗时: {total_time/max(total_urls, 1):.2f}秒/URL"
         )
 
         return results
 
+    async def crawl_multiple_urls_iter(
+        self,
+        urls: List[str],
+        prompts: Optional[List[str]] = None,
+        max_concurrent: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        并发爬取多个URL，按完成顺序逐个产出结果
+
+        与 crawl_multiple_urls 不同，慢URL不会阻塞已完成结果的处理；
+        结果中的 batch_index 对应URL在输入列表中的位置（从1开始）。
+
+        Args:
+            urls: URL列表
+            prompts: 可选的LLM提示列表，与urls对应
+            max_concurrent: 最大并发数，默认3
+
+        Yields:
+            单个URL的爬取结果
+        """
+        if not self.browser:
+            raise RuntimeError(
+                "Spider未初始化，请使用 async with Spider(...) as spider:"
+            )
+
+        if prompts and len(prompts) != len(urls):
+            raise ValueError("prompts数量必须与urls数量相等或为None")
+
+        gate = _AdmissionGate(max_concurrent)
+        self._admission_gate = gate
+
+        tasks = [
+            asyncio.create_task(
+                self._crawl_gated(gate, i, url, prompts[i - 1] if prompts else None),
+                name=f"crawl_iter_url_{i}",
+            )
+            for i, url in enumerate(urls, 1)
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 调用方提前结束迭代时取消剩余任务
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if self._admission_gate is gate:
+                self._admission_gate = None
+
+    async def _crawl_gated(
+        self, gate: _AdmissionGate, index: int, url: str, prompt: Optional[str]
+    ) -> Dict[str, Any]:
+        """经并发闸门准入后爬取单个URL，异常转换为错误结果"""
+        async with gate:
+            try:
+                # 与逐个调用 crawl 一致，不额外等待 spider_config.delay
+                result = await self._crawl_with_context(
+                    url, prompt, index, apply_delay=False
+                )
+            except Exception as e:
+                logger.error(f"URL {index} 爬取异常: {e}")
+                result = {
+                    "url": url,
+                    "timestamp": time.time(),
+                    "error": str(e),
+                    "extraction_time": 0,
+                }
+            result["batch_index"] = index
+            return result
+
+    async def set_concurrency(self, max_concurrent: int):
+        """调整正在进行的 crawl_multiple_urls_iter 的最大并发数"""
+        if self._admission_gate is None:
+            logger.warning("当前没有进行中的并发爬取，忽略并发数调整")
+            return
+        await self._admission_gate.set_limit(max_concurrent)
+        logger.info(f"并发数已调整为: {self._admission_gate.limit}")
+
     async def _crawl_with_context(
-        self, url: str, prompt: Optional[str], index: int
+        self, url: str, prompt: Optional[str], index: int, apply_delay: bool = True
     ) -> Dict[str, Any]:
         """
-        使用独立上下文爬取单个URL
+        使用上下文池中的浏览器上下文爬取单个URL
 
         Args:
             url: 目标URL
             prompt: LLM提示
             index: URL索引（用于日志）
+            apply_delay: 访问页面后是否等待 spider_config.delay
 
         Returns:
             爬取结果
         """
-        # 创建独立的浏览器上下文
-        context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=self.config.spider_config.user_agent,
-            ignore_https_errors=True,
-            java_script_enabled=True,
-        )
+        cached_result = await self._get_cached_result(url, prompt)
+        if cached_result is not None:
+            return cached_result
 
         logger.info(f"[{index}] 开始爬取: {url}")
         start_time = time.time()
 
         try:
-            # 创建页面
-            page = await context.new_page()
-
-            try:
+            # 从上下文池借用上下文创建页面
+            async with self._pooled_page() as page:
                 # 访问页面
-                await page.goto(
-                    url,
-                    wait_until="domcontentloaded",
-                    timeout=self.config.spider_config.timeout,
-                )
-                await page.wait_for_load_state("networkidle")
+                await self._navigate(page, url)
 
                 # 应用延迟
-                if self.config.spider_config.delay > 0:
+                if apply_delay and self.config.spider_config.delay > 0:
                     await asyncio.sleep(self.config.spider_config.delay)
 
                 # 并发执行所有提取器
-                extraction_results = {}
-                extraction_tasks = []
-
-                for name, extractor in self._extractors.items():
-                    task = asyncio.create_task(
-                        self._safe_extract_for_context(name, extractor, page),
-                        name=f"extract_{name}_url_{index}",
-                    )
-                    extraction_tasks.append((name, task))
-
-                # 等待所有提取任务完成
-                if extraction_tasks:
-                    completed_tasks = await asyncio.gather(
-                        *[task for _, task in extraction_tasks], return_exceptions=True
-                    )
-
-                    # 处理提取结果
-                    for (name, _), result in zip(extraction_tasks, completed_tasks):
-                        if isinstance(result, Exception):
-                            logger.error(f"[{index}] 提取器 {name} 执行失败: {result}")
-                            extraction_results[name] = {"error": str(result)}
-                        else:
-                            extraction_results[name] = result
-                            count = self._get_result_count(result)
-                            logger.info(
-                                f"[{index}] 提取器 {name} 完成，提取到 {count} 项"
-                            )
+                extraction_results = await self._run_extractors(page, f"[{index}] ")
 
                 # 构建最终结果
                 final_result = {
                     "url": url,
                     "timestamp": time.time(),
                     "extraction_time": time.time() - start_time,
-                    "extractors_used": list(self._extractors.keys()),
+                    "extractors_used": list(self._extractor_names),
                     "results": extraction_results,
                 }
 
@@ -469,11 +776,9 @@ class Spider:
                 logger.info(
                     f"[{index}] 爬取完成: {url}, 耗时: {final_result['extraction_time']:.2f}秒"
                 )
+                await self._cache_result(url, prompt, final_result)
                 return final_result
 
-            finally:
-                await page.close()
-
         except Exception as e:
             logger.error(f"[{index}] 爬取失败: {url}, 错误: {e}")
             return {
@@ -482,25 +787,102 @@ class Spider:
                 "error": str(e),
                 "extraction_time": time.time() - start_time,
             }
-        finally:
-            await context.close()
 
-    async def _safe_extract_for_context(
-        self, name: str, extractor: Any, page: Page
-    ) -> Dict[str, Any]:
-        """为上下文爬取安全执行提取器"""
+    async def _navigate(self, page: Page, url: str):
+        """
+        访问URL，由 goto 直接等待 networkidle，省去额外的 wait_for_load_state 调用
+
+        启用 spider_config.retry_navigation 时，超时及连接重置/拒绝/超时等瞬时网络错误
+        按 retry_times 重试，退避间隔带去相关抖动；DNS解析失败、无效URL等错误直接抛出。
+        每次尝试只使用剩余的超时时间，整个导航的总耗时不超过 spider_config.timeout。
+        """
+        deadline = time.monotonic() + self.config.spider_config.timeout / 1000
+
+        async def goto():
+            remaining = max(deadline - time.monotonic(), 0.001)
+            return await page.goto(
+                url, wait_until="networkidle", timeout=remaining * 1000
+            )
+
+        await self._nav_retry.retry_async(goto)
+
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """
+        从上下文池借用浏览器上下文并创建页面
+
+        上下文承载的页面数达到 max_pages_per_context 后关闭并在下次借用时重建，
+        避免长期存活的上下文累积内存；设为1时每个URL使用全新上下文。
+        启用 reuse_page_across_batch 时页面随上下文归还，下次借用时直接复用。
+        """
+        if self._context_pool:
+            context = self._context_pool.pop()
+        else:
+            context = await self._new_context(ignore_https_errors=True)
+        self._context_uses[context] = self._context_uses.get(context, 0) + 1
+
+        spider_config = self.config.spider_config
+        page = self._idle_pages.pop(context, None)
         try:
-            return await extractor.extract(page)
-        except Exception as e:
-            logger.error(f"提取器 {name} 执行异常: {e}")
-            raise
+            if page is None:
+                page = await context.new_page()
+            yield page
+        finally:
+            keep_context = (
+                self.browser is not None
+                and self._context_uses[context] < spider_config.max_pages_per_context
+            )
+
+            if page is not None:
+                try:
+                    if keep_context and spider_config.reuse_page_across_batch:
+                        # 重置为空白页后留给下一个URL使用
+                        await page.goto("about:blank")
+                        self._idle_pages[context] = page
+                    else:
+                        await page.close()
+                except Exception:
+                    pass
+
+            if keep_context:
+                self._context_pool.append(context)
+            else:
+                del self._context_uses[context]
+                await context.close()
+
+    async def _run_extractors(self, page: Page, log_prefix: str = "") -> Dict[str, Any]:
+        """按预先构建的提取计划并发执行所有启用的提取器，失败的提取器记录错误信息"""
+        if not self._extract_plan:
+            return {}
+
+        outcomes = await asyncio.gather(
+            *(
+                self._safe_extract(name, extract, page)
+                for name, extract in self._extract_plan
+            ),
+            return_exceptions=True,
+        )
+
+        extraction_results: Dict[str, Any] = {}
+        for name, result in zip(self._extractor_names, outcomes):
+            if isinstance(result, Exception):
+                logger.error(f"{log_prefix}提取器 {name} 执行失败: {result}")
+                extraction_results[name] = {"error": str(result)}
+            else:
+                extraction_results[name] = result
+                count = self._get_result_count(result)
+                logger.info(f"{log_prefix}提取器 {name} 完成，提取到 {count} 项")
+        return extraction_results
 
     async def _safe_extract(
-        self, name: str, extractor: Any, page: Page
+        self,
+        name: str,
+        extract: Callable[[Page], Awaitable[Dict[str, Any]]],
+        page: Page,
     ) -> Dict[str, Any]:
         """安全执行提取器"""
         try:
-            return await extractor.extract(page)
+            return await extract(page)
         except Exception as e:
             logger.error(f"提取器 {name} 执行异常: {e}")
             raise
@@ -599,6 +981,7 @@ class Spider:
         enable_text: bool = True,
         enable_links: bool = False,
         enable_images: bool = False,
+        enable_data: bool = False,
         enable_llm: bool = False,
         **kwargs,
     ) -> "Spider":
@@ -608,8 +991,9 @@ class Spider:
                 enable_text=enable_text,
                 enable_links=enable_links,
                 enable_images=enable_images,
+                enable_data=enable_data,
             ),
             llm_config=LLMConfig(enabled=enable_llm, **kwargs.get("llm_config", {})),
-            spider_config=SpiderConfig(**kwargs.get("spider_config", {})),
+            spider_config=SpiderConfig.model_validate(kwargs.get("spider_config", {})),
         )
         return cls(config)
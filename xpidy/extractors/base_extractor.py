@@ -2,9 +2,10 @@
 数据提取器基类
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Set, Union
-from urllib.parse import urljoin
+from urllib.parse import urlparse
 
 from playwright.async_api import Page
 from pydantic import BaseModel, Field
@@ -12,6 +13,63 @@ from pydantic import BaseModel, Field
 from ..core.config import ExtractionConfig
 from ..utils import ContentUtils, URLUtils
 
+# 一次性完成脚本/样式移除并读取内容文本，排除选择器匹配的子树在遍历时直接跳过
+_PAGE_CONTENT_JS = """
+    ({contentSelectors, excludeSelectors, removeScripts, removeStyles}) => {
+        if (removeScripts) {
+            document.querySelectorAll('script').forEach(el => el.remove());
+        }
+        if (removeStyles) {
+            document.querySelectorAll('style').forEach(el => el.remove());
+        }
+
+        // 只标记不删除排除元素，避免影响同一页面上并发运行的其他提取器
+        const excluded = new Set();
+        const unsupportedExcludes = [];
+        for (const selector of excludeSelectors) {
+            try {
+                document.querySelectorAll(selector).forEach(el => excluded.add(el));
+            } catch (e) {
+                // 非原生CSS选择器（如Playwright扩展语法）交由Python端处理
+                unsupportedExcludes.push(selector);
+            }
+        }
+
+        const textOf = (root) => {
+            if (!root) return '';
+            if (!excluded.size) return root.textContent || '';
+            if (excluded.has(root)) return '';
+            const parts = [];
+            const walker = document.createTreeWalker(
+                root,
+                NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT,
+                {
+                    acceptNode: node => excluded.has(node)
+                        ? NodeFilter.FILTER_REJECT
+                        : NodeFilter.FILTER_ACCEPT
+                }
+            );
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                if (node.nodeType === Node.TEXT_NODE) parts.push(node.data);
+            }
+            return parts.join('');
+        };
+
+        const collect = (selector) => {
+            try {
+                return Array.from(document.querySelectorAll(selector), textOf);
+            } catch (e) {
+                return null;
+            }
+        };
+        return {
+            content: contentSelectors.map(collect),
+            body: contentSelectors.length ? null : textOf(document.body),
+            unsupportedExcludes,
+        };
+    }
+"""
+
 
 class BaseExtractorConfig(BaseModel):
     """提取器基础配置"""
@@ -37,9 +95,17 @@ class BaseExtractorConfig(BaseModel):
 class BaseExtractor(ABC):
     """数据提取器基类"""
 
+    # 超过该长度（字符）的文本在线程池中清理，避免长时间占用事件循环
+    OFFLOAD_THRESHOLD = 64 * 1024
+
     def __init__(self, config: Optional[BaseExtractorConfig] = None):
         self.config = config or self.get_default_config()
         self._cached_results: Optional[Dict[str, Any]] = None
+        # 预先组装提取范围选择器（CSS 在前，XPath 转为 Playwright 的 xpath= 形式）
+        self._scope_selectors = (
+            *(self.config.selectors or ()),
+            *(f"xpath={xpath}" for xpath in self.config.xpath_selectors or ()),
+        )
 
     @classmethod
     @abstractmethod
@@ -66,23 +132,11 @@ class BaseExtractor(ABC):
         """获取提取范围内的元素"""
         elements = []
 
-        # CSS选择器
-        if self.config.selectors:
-            for selector in self.config.selectors:
-                try:
-                    scope_elements = await page.query_selector_all(selector)
-                    elements.extend(scope_elements)
-                except Exception:
-                    continue
-
-        # XPath选择器
-        if self.config.xpath_selectors:
-            for xpath in self.config.xpath_selectors:
-                try:
-                    scope_elements = await page.query_selector_all(f"xpath={xpath}")
-                    elements.extend(scope_elements)
-                except Exception:
-                    continue
+        for selector in self._scope_selectors:
+            try:
+                elements.extend(await page.query_selector_all(selector))
+            except Exception:
+                continue
 
         # 如果没有指定选择器，返回整个页面
         if not elements:
@@ -96,7 +150,10 @@ class BaseExtractor(ABC):
             return text
 
         if self.config.normalize_whitespace:
-            text = ContentUtils.normalize_whitespace(text)
+            if len(text) > self.OFFLOAD_THRESHOLD:
+                text = await asyncio.to_thread(ContentUtils.normalize_whitespace, text)
+            else:
+                text = ContentUtils.normalize_whitespace(text)
 
         return text
 
@@ -110,6 +167,7 @@ class BaseExtractor(ABC):
         """通用的过滤和去重逻辑"""
         processed = []
         seen_items: Set[str] = set()
+        seen_raw_urls: Set[str] = set()
 
         for item in items:
             try:
@@ -118,7 +176,13 @@ class BaseExtractor(ABC):
 
                 # 转换为绝对URL（如果是URL）
                 if url_key in item and item[url_key]:
-                    absolute_url = urljoin(base_url, item[url_key])
+                    # 原始URL相同则绝对URL必然相同，先按原始字符串去重以跳过重复解析
+                    if self.config.deduplicate:
+                        if item[url_key] in seen_raw_urls:
+                            continue
+                        seen_raw_urls.add(item[url_key])
+
+                    absolute_url = URLUtils.join_url(base_url, item[url_key])
                     if URLUtils.is_valid_url(absolute_url):
                         item[url_key] = absolute_url
                         unique_key = absolute_url
@@ -197,72 +261,73 @@ class BaseExtractor(ABC):
         """将相对URL转换为绝对URL"""
         for item in items:
             if url_key in item:
-                item[url_key] = urljoin(base_url, item[url_key])
+                item[url_key] = URLUtils.join_url(base_url, item[url_key])
         return items
 
     def _add_url_metadata(
         self, items: List[Dict[str, Any]], base_url: str, url_key: str = "url"
     ) -> List[Dict[str, Any]]:
         """为URL添加元数据信息"""
+        base_domain = URLUtils.extract_domain(base_url)
         for item in items:
             url = item.get(url_key, "")
             if url:
-                item["domain"] = URLUtils.extract_domain(url)
-                item["is_internal"] = URLUtils.is_same_domain(base_url, url)
-                item["file_extension"] = URLUtils.get_file_extension_from_url(url)
+                # 每个URL只解析一次，由同一结果得到域名和文件扩展名
+                try:
+                    parsed = urlparse(url)
+                    domain, path = parsed.netloc.lower() or None, parsed.path
+                except ValueError:
+                    domain, path = None, ""
+                item["domain"] = domain
+                item["is_internal"] = domain is not None and domain == base_domain
+                item["file_extension"] = (
+                    path.split(".")[-1].lower() if "." in path else None
+                )
                 item["is_absolute"] = URLUtils.is_absolute_url(
                     item.get("original_" + url_key, url)
                 )
         return items
 
     async def _get_page_content(self, page: Page) -> str:
-        """获取页面内容"""
-        # 移除脚本和样式
-        if self.config.remove_scripts:
-            await page.evaluate(
-                "() => { document.querySelectorAll('script').forEach(el => el.remove()); }"
-            )
-
-        if self.config.remove_styles:
-            await page.evaluate(
-                "() => { document.querySelectorAll('style').forEach(el => el.remove()); }"
-            )
-
-        # 根据选择器获取内容
-        if self.config.content_selectors:
+        """获取页面内容，脚本样式移除与各选择器的文本读取合并为一次 evaluate 调用"""
+        content_selectors = getattr(self.config, "content_selectors", None) or []
+        exclude_selectors = self.config.exclude_selectors or []
+        snapshot = await page.evaluate(
+            _PAGE_CONTENT_JS,
+            {
+                "contentSelectors": content_selectors,
+                "excludeSelectors": exclude_selectors,
+                "removeScripts": getattr(self.config, "remove_scripts", False),
+                "removeStyles": getattr(self.config, "remove_styles", False),
+            },
+        )
+
+        # 根据选择器获取内容，未指定时使用整个页面内容
+        if content_selectors:
             content_parts = []
-            for selector in self.config.content_selectors:
-                try:
-                    elements = page.locator(selector)
-                    count = await elements.count()
-                    for i in range(count):
-                        element = elements.nth(i)
-                        text = await element.text_content()
-                        if text:
-                            content_parts.append(text)
-                except Exception:
-                    continue
+            for selector, texts in zip(content_selectors, snapshot["content"]):
+                if texts is None:
+                    texts = await self._locator_texts(page, selector)
+                content_parts.extend(text for text in texts if text)
             content = "\n".join(content_parts)
         else:
-            # 获取整个页面内容
-            content = await page.text_content("body") or ""
+            content = snapshot["body"]
 
-        # 排除指定的内容
-        if self.config.exclude_selectors:
-            for selector in self.config.exclude_selectors:
-                try:
-                    elements = page.locator(selector)
-                    count = await elements.count()
-                    for i in range(count):
-                        element = elements.nth(i)
-                        text = await element.text_content()
-                        if text and text in content:
-                            content = content.replace(text, "")
-                except Exception:
-                    continue
+        # 原生CSS排除选择器已在页面内跳过，其余选择器按文本移除
+        for selector in snapshot["unsupportedExcludes"]:
+            for text in await self._locator_texts(page, selector):
+                if text and text in content:
+                    content = content.replace(text, "")
 
         return await self._clean_text(content)
 
+    async def _locator_texts(self, page: Page, selector: str) -> List[str]:
+        """通过Playwright定位器读取匹配元素的文本，用于非原生CSS选择器"""
+        try:
+            return await page.locator(selector).all_text_contents()
+        except Exception:
+            return []
+
     async def _extract_links(self, page: Page) -> List[Dict[str, str]]:
         """提取链接"""
         if not self.config.extract_links:
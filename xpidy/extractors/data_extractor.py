@@ -2,6 +2,7 @@
 结构化数据提取器
 """
 
+import asyncio
 import json
 import time
 from typing import Any, Dict, List, Optional
@@ -12,12 +13,45 @@ from pydantic import Field
 
 from ..core.config import ExtractionConfig
 from ..core.llm_processor import LLMProcessor
+from ..utils import json_loads
 from .base_extractor import BaseExtractor, BaseExtractorConfig
 
 
+# 在浏览器内一次执行全部自定义选择器，返回 {名称: [文本, ...]}
+_CUSTOM_SELECTORS_JS = """
+    (selectors) => {
+        const out = {};
+        for (const [name, selector] of Object.entries(selectors)) {
+            try {
+                out[name] = Array.from(
+                    document.querySelectorAll(selector),
+                    el => el.textContent || ''
+                );
+            } catch (e) {
+                // 非原生CSS选择器（如Playwright扩展语法）交由Python端处理
+                out[name] = null;
+            }
+        }
+        return out;
+    }
+"""
+
+
 class DataExtractorConfig(BaseExtractorConfig):
     """数据提取器配置"""
 
+    # 页面内容与 LLM 结构化输出
+    include_raw_content: bool = Field(
+        default=True, description="结果中包含页面原始文本，关闭后无需时不读取页面文本"
+    )
+    structured_output: bool = Field(default=False, description="使用LLM输出结构化数据")
+    output_schema: Optional[Dict[str, Any]] = Field(
+        default=None, description="结构化输出模式"
+    )
+    enable_llm_processing: bool = Field(
+        default=False, description="使用LLM处理提取的表格数据"
+    )
+
     # 结构化数据提取
     extract_json_ld: bool = Field(default=True, description="提取JSON-LD数据")
     extract_microdata: bool = Field(default=True, description="提取微数据")
@@ -68,75 +102,71 @@ class DataExtractor(BaseExtractor):
         try:
             result = {}
 
-            # 提取基本内容
-            content = await self._get_page_content(page)
-            result["raw_content"] = content
-
-            # 如果启用结构化输出且配置了输出模式
-            if self.config.structured_output and self.config.output_schema:
-                if self.llm_processor:
-                    try:
-                        custom_prompt = kwargs.get("custom_prompt")
-                        structured_data = (
-                            await self.llm_processor.extract_structured_data(
-                                content=content,
-                                schema=self.config.output_schema,
-                                custom_prompt=custom_prompt,
-                            )
-                        )
-                        result["structured_data"] = structured_data
-
-                    except Exception as e:
-                        logger.warning(f"结构化数据提取失败: {e}")
-                        result["extraction_error"] = str(e)
-                else:
-                    logger.warning("启用了结构化输出但未配置 LLM 处理器")
-
-            # 提取其他数据
+            use_structured = bool(
+                self.config.structured_output and self.config.output_schema
+            )
+            if use_structured and not self.llm_processor:
+                logger.warning("启用了结构化输出但未配置 LLM 处理器")
+                use_structured = False
+
+            # 页面文本仅在需要返回原始内容或进行结构化输出时读取
+            content = None
+            if self.config.include_raw_content or use_structured:
+                content = await self._get_page_content(page)
+            result["raw_content"] = content if self.config.include_raw_content else None
+
+            # 结构化输出的LLM调用与页面提取项并发执行
+            structured_job = None
+            if use_structured:
+                structured_job = self._extract_structured_output(
+                    content, kwargs.get("custom_prompt")
+                )
+
+            # 其余提取项互不依赖，在页面上并发执行
+            jobs = []
             if self.config.extract_links:
-                result["links"] = await self._extract_links(page)
-
+                jobs.append(("links", self._extract_links))
             if self.config.extract_images:
-                result["images"] = await self._extract_images(page)
-
+                jobs.append(("images", self._extract_images))
             if self.config.extract_metadata:
-                result["metadata"] = await self._extract_metadata(page)
-
-            # 尝试提取 JSON-LD 结构化数据
+                jobs.append(("metadata", self._extract_metadata))
+            # JSON-LD 结构化数据
             if self.config.extract_json_ld:
-                result["json_ld"] = await self._extract_json_ld(page)
-
-            # 尝试提取 Schema.org 微数据
+                jobs.append(("json_ld", self._extract_json_ld))
+            # Schema.org 微数据
             if self.config.extract_microdata:
-                result["microdata"] = await self._extract_microdata(page)
-
-            # 提取 OpenGraph 数据
+                jobs.append(("microdata", self._extract_microdata))
+            # OpenGraph 数据
             if self.config.extract_opengraph:
-                result["opengraph"] = await self._extract_opengraph(page)
-
-            # 提取 Twitter 卡片数据
+                jobs.append(("opengraph", self._extract_opengraph))
+            # Twitter 卡片数据
             if self.config.extract_twitter_cards:
-                result["twitter_cards"] = await self._extract_twitter_cards(page)
-
-            # 提取 META 标签
+                jobs.append(("twitter_cards", self._extract_twitter_cards))
+            # META 标签
             if self.config.extract_meta_tags:
-                result["meta_tags"] = await self._extract_meta_tags(page)
-
-            # 提取表格数据
+                jobs.append(("meta_tags", self._extract_meta_tags))
+            # 表格数据
             if self.config.extract_tables:
-                result["tables"] = await self._extract_tables(page)
-
-            # 提取列表数据
+                jobs.append(("tables", self._extract_tables))
+            # 列表数据
             if self.config.extract_lists:
-                result["lists"] = await self._extract_lists(page)
-
-            # 自定义选择器提取
+                jobs.append(("lists", self._extract_lists))
+            # 自定义选择器
             if self.config.custom_selectors:
-                result["custom_data"] = await self._extract_custom_data(page)
+                jobs.append(("custom_data", self._extract_custom_data))
+
+            coros = [extract(page) for _, extract in jobs]
+            if structured_job is not None:
+                coros.append(structured_job)
+            if coros:
+                values = await asyncio.gather(*coros)
+                if structured_job is not None:
+                    result.update(values.pop())
+                result.update(zip((key for key, _ in jobs), values))
 
             # 添加页面信息
             result["url"] = page.url
-            result["timestamp"] = __import__("time").time()
+            result["timestamp"] = time.time()
 
             logger.info(f"结构化数据提取完成，URL: {page.url}")
             return result
@@ -145,6 +175,21 @@ class DataExtractor(BaseExtractor):
             logger.error(f"结构化数据提取失败: {e}")
             raise
 
+    async def _extract_structured_output(
+        self, content: str, custom_prompt: Optional[str]
+    ) -> Dict[str, Any]:
+        """使用 LLM 按输出模式提取结构化数据，失败时返回错误信息"""
+        try:
+            structured_data = await self.llm_processor.extract_structured_data(
+                content=content,
+                schema=self.config.output_schema,
+                custom_prompt=custom_prompt,
+            )
+            return {"structured_data": structured_data}
+        except Exception as e:
+            logger.warning(f"结构化数据提取失败: {e}")
+            return {"extraction_error": str(e)}
+
     async def extract_with_schema(
         self, page: Page, schema: Dict[str, Any], custom_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -165,7 +210,7 @@ class DataExtractor(BaseExtractor):
                 "structured_data": structured_data,
                 "raw_content": content,
                 "url": page.url,
-                "timestamp": __import__("time").time(),
+                "timestamp": time.time(),
                 "extraction_method": "schema_based",
                 "schema": schema,
             }
@@ -206,7 +251,7 @@ class DataExtractor(BaseExtractor):
                 "tables": tables or [],
                 "table_count": len(tables or []),
                 "url": page.url,
-                "timestamp": __import__("time").time(),
+                "timestamp": time.time(),
                 "extraction_method": "table_extraction",
             }
 
@@ -275,7 +320,7 @@ class DataExtractor(BaseExtractor):
                 "forms": forms or [],
                 "form_count": len(forms or []),
                 "url": page.url,
-                "timestamp": __import__("time").time(),
+                "timestamp": time.time(),
                 "extraction_method": "form_extraction",
             }
 
@@ -289,24 +334,23 @@ class DataExtractor(BaseExtractor):
     async def _extract_json_ld(self, page: Page) -> List[Dict[str, Any]]:
         """提取 JSON-LD 结构化数据"""
         try:
-            json_ld_data = await page.evaluate(
+            # 浏览器端只返回原始文本，在Python端解析一次，省去JS解析后再序列化回传
+            raw_scripts = await page.evaluate(
                 """
-                () => {
-                    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                    const data = [];
-                    scripts.forEach(script => {
-                        try {
-                            const content = JSON.parse(script.textContent);
-                            data.push(content);
-                        } catch (e) {
-                            // 忽略解析错误
-                        }
-                    });
-                    return data;
-                }
+                () => Array.from(
+                    document.querySelectorAll('script[type="application/ld+json"]'),
+                    script => script.textContent
+                )
             """
             )
-            return json_ld_data or []
+            json_ld_data = []
+            for raw in raw_scripts or []:
+                try:
+                    json_ld_data.append(json_loads(raw))
+                except (TypeError, ValueError):
+                    # 忽略解析错误
+                    continue
+            return json_ld_data
         except Exception:
             return []
 
@@ -457,8 +501,8 @@ class DataExtractor(BaseExtractor):
                 text_parts.append(" | ".join(table["headers"]))
                 text_parts.append("-" * 50)
 
-            for row in table.get("rows", []):
-                text_parts.append(" | ".join(str(cell) for cell in row))
+            # 单元格文本由页面脚本保证为字符串，可直接拼接
+            text_parts.extend(map(" | ".join, table.get("rows", [])))
 
             text_parts.append("")  # 空行分隔
 
@@ -538,22 +582,29 @@ class DataExtractor(BaseExtractor):
         """提取自定义选择器数据"""
         custom_data = {}
 
+        # 在浏览器内一次执行所有选择器，避免逐个元素往返调用
+        try:
+            texts_by_name = await page.evaluate(
+                _CUSTOM_SELECTORS_JS,
+                self.config.custom_selectors,
+            )
+        except Exception:
+            texts_by_name = {}
+
         for name, selector in self.config.custom_selectors.items():
             try:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    if len(elements) == 1:
-                        text = await elements[0].text_content()
-                        custom_data[name] = await self._clean_text(text or "")
-                    else:
-                        texts = []
-                        for element in elements:
-                            text = await element.text_content()
-                            if text:
-                                texts.append(await self._clean_text(text))
-                        custom_data[name] = texts
-                else:
+                texts = texts_by_name.get(name)
+                if texts is None:
+                    texts = await page.locator(selector).all_text_contents()
+
+                if not texts:
                     custom_data[name] = None
+                elif len(texts) == 1:
+                    custom_data[name] = await self._clean_text(texts[0])
+                else:
+                    custom_data[name] = [
+                        await self._clean_text(text) for text in texts if text
+                    ]
             except Exception:
                 custom_data[name] = None
 
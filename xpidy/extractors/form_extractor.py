@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from playwright.async_api import Page
 from pydantic import Field
 
+from ..utils import URLUtils
 from .base_extractor import BaseExtractor, BaseExtractorConfig
 
 
@@ -201,9 +202,7 @@ class FormExtractor(BaseExtractor):
         # 处理action URL
         action = form_data.get("action", "")
         if action:
-            from urllib.parse import urljoin
-
-            form_data["action"] = urljoin(base_url, action)
+            form_data["action"] = URLUtils.join_url(base_url, action)
             form_data["is_external_action"] = not action.startswith(base_url)
 
         # 过滤字段
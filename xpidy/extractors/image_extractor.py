@@ -5,7 +5,7 @@
 import base64
 import time
 from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 from loguru import logger
 from playwright.async_api import Page
@@ -49,6 +49,13 @@ class ImageExtractor(BaseExtractor):
 
     def __init__(self, config: Optional[ImageExtractorConfig] = None):
         super().__init__(config)
+        # 预先构建格式集合，逐图片过滤时按哈希查找
+        self._allowed_formats = frozenset(
+            fmt.lower() for fmt in self.config.allowed_formats
+        )
+        self._exclude_formats = frozenset(
+            fmt.lower() for fmt in self.config.exclude_formats
+        )
 
     @classmethod
     def get_default_config(cls) -> ImageExtractorConfig:
@@ -197,19 +204,16 @@ class ImageExtractor(BaseExtractor):
             return None
 
         # 转换为绝对URL
-        absolute_url = urljoin(base_url, src)
+        absolute_url = URLUtils.join_url(base_url, src)
         parsed_url = urlparse(absolute_url)
 
         # 获取文件扩展名
         file_extension = self._get_file_extension(absolute_url)
 
         # 格式过滤
-        if (
-            self.config.allowed_formats
-            and file_extension not in self.config.allowed_formats
-        ):
+        if self._allowed_formats and file_extension not in self._allowed_formats:
             return None
-        if file_extension in self.config.exclude_formats:
+        if file_extension in self._exclude_formats:
             return None
 
         # 尺寸过滤
@@ -281,39 +285,49 @@ class ImageExtractor(BaseExtractor):
         if not images:
             return {}
 
-        stats = {
-            "by_format": {},
-            "by_domain": {},
-            "size_distribution": {
-                "small": 0,  # < 100x100
-                "medium": 0,  # 100x100 - 500x500
-                "large": 0,  # > 500x500
-            },
-            "lazy_loaded": sum(1 for img in images if img.get("is_lazy", False)),
-            "with_alt": sum(1 for img in images if img.get("alt", "")),
-            "total_area": sum(img.get("area", 0) for img in images),
-        }
+        by_format: Dict[str, int] = {}
+        by_domain: Dict[str, int] = {}
+        small = medium = large = 0
+        lazy_loaded = with_alt = total_area = 0
 
+        # 单次遍历完成全部统计
         for image in images:
             # 按格式统计
             ext = image.get("file_extension", "unknown")
-            stats["by_format"][ext] = stats["by_format"].get(ext, 0) + 1
+            by_format[ext] = by_format.get(ext, 0) + 1
 
             # 按域名统计
             domain = image.get("domain", "unknown")
-            stats["by_domain"][domain] = stats["by_domain"].get(domain, 0) + 1
+            by_domain[domain] = by_domain.get(domain, 0) + 1
 
             # 尺寸分布
             width = image.get("width", 0)
             height = image.get("height", 0)
             if width < 100 or height < 100:
-                stats["size_distribution"]["small"] += 1
+                small += 1
             elif width <= 500 and height <= 500:
-                stats["size_distribution"]["medium"] += 1
+                medium += 1
             else:
-                stats["size_distribution"]["large"] += 1
+                large += 1
 
-        return stats
+            if image.get("is_lazy", False):
+                lazy_loaded += 1
+            if image.get("alt", ""):
+                with_alt += 1
+            total_area += image.get("area", 0)
+
+        return {
+            "by_format": by_format,
+            "by_domain": by_domain,
+            "size_distribution": {
+                "small": small,  # < 100x100
+                "medium": medium,  # 100x100 - 500x500
+                "large": large,  # > 500x500
+            },
+            "lazy_loaded": lazy_loaded,
+            "with_alt": with_alt,
+            "total_area": total_area,
+        }
 
     def _apply_custom_filters(self, item: Dict[str, Any], **filters) -> bool:
         """应用自定义过滤器"""
@@ -325,10 +339,8 @@ class ImageExtractor(BaseExtractor):
         # 文件名过滤
         if filters.get("filename_patterns"):
             src = item.get("src", "")
-            import re
-
-            patterns = filters["filename_patterns"]
-            if not any(re.search(pattern, src, re.IGNORECASE) for pattern in patterns):
+            matches = URLUtils.compile_url_matcher(tuple(filters["filename_patterns"]))
+            if not matches(src):
                 return False
 
         return True
@@ -554,6 +566,7 @@ class ImageExtractor(BaseExtractor):
             by_format = {}
             by_size = {"small": 0, "medium": 0, "large": 0}
             by_parent = {}
+            with_alt = with_title = with_links = with_captions = 0
 
             total_width = 0
             total_height = 0
@@ -579,6 +592,12 @@ class ImageExtractor(BaseExtractor):
                 parent = image.get("parentTag", "unknown")
                 by_parent[parent] = by_parent.get(parent, 0) + 1
 
+                # 属性计数
+                with_alt += bool(image.get("alt"))
+                with_title += bool(image.get("title"))
+                with_links += bool(image.get("linkUrl"))
+                with_captions += bool(image.get("caption"))
+
                 # 累计尺寸
                 total_width += image.get("width", 0)
                 total_height += image.get("height", 0)
@@ -590,20 +609,14 @@ class ImageExtractor(BaseExtractor):
                 "by_format": by_format,
                 "by_size": by_size,
                 "by_parent_element": by_parent,
-                "images_with_alt": len([img for img in images if img.get("alt")]),
-                "images_with_title": len([img for img in images if img.get("title")]),
-                "images_with_links": len([img for img in images if img.get("linkUrl")]),
-                "images_with_captions": len(
-                    [img for img in images if img.get("caption")]
-                ),
+                "images_with_alt": with_alt,
+                "images_with_title": with_title,
+                "images_with_links": with_links,
+                "images_with_captions": with_captions,
                 "avg_width": round(total_width / len(images), 2) if images else 0,
                 "avg_height": round(total_height / len(images), 2) if images else 0,
-                "inline_svg_count": len(
-                    [img for img in images if img.get("type") == "svg"]
-                ),
-                "background_images": len(
-                    [img for img in images if img.get("type") == "background"]
-                ),
+                "inline_svg_count": by_type.get("svg", 0),
+                "background_images": by_type.get("background", 0),
                 "timestamp": time.time(),
                 "extraction_method": "image_analysis",
             }
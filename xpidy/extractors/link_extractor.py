@@ -4,8 +4,8 @@
 
 import re
 import time
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
 
 from loguru import logger
 from playwright.async_api import Page
@@ -53,6 +53,22 @@ class LinkExtractor(BaseExtractor):
 
     def __init__(self, config: Optional[LinkExtractorConfig] = None):
         super().__init__(config)
+        # 预编译包含/排除模式，每个URL只需各匹配一次
+        self._include_match = self._compile_matcher(self.config.include_patterns)
+        self._exclude_match = self._compile_matcher(self.config.exclude_patterns)
+
+    @staticmethod
+    def _compile_matcher(patterns: List[str]) -> Optional[Callable[[str], bool]]:
+        """构建URL模式匹配函数，跳过无效的正则表达式并记录错误"""
+        valid_patterns = []
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                logger.error(f"正则表达式错误: {pattern} - {e}")
+                continue
+            valid_patterns.append(pattern)
+        return URLUtils.compile_url_matcher(tuple(valid_patterns))
 
     @classmethod
     def get_default_config(cls) -> LinkExtractorConfig:
@@ -151,7 +167,7 @@ class LinkExtractor(BaseExtractor):
             return None
 
         # 转换为绝对URL
-        absolute_url = urljoin(base_url, url)
+        absolute_url = URLUtils.join_url(base_url, url)
         parsed_url = urlparse(absolute_url)
         base_domain = urlparse(base_url).netloc
 
@@ -220,20 +236,12 @@ class LinkExtractor(BaseExtractor):
     def _matches_patterns(self, url: str) -> bool:
         """检查URL是否匹配模式"""
         # 检查包含模式
-        if self.config.include_patterns:
-            if not any(
-                re.search(pattern, url, re.IGNORECASE)
-                for pattern in self.config.include_patterns
-            ):
-                return False
+        if self._include_match and not self._include_match(url):
+            return False
 
         # 检查排除模式
-        if self.config.exclude_patterns:
-            if any(
-                re.search(pattern, url, re.IGNORECASE)
-                for pattern in self.config.exclude_patterns
-            ):
-                return False
+        if self._exclude_match and self._exclude_match(url):
+            return False
 
         return True
 
@@ -288,7 +296,7 @@ class LinkExtractor(BaseExtractor):
 
             for path in sitemap_paths:
                 try:
-                    sitemap_url = urljoin(current_url, path)
+                    sitemap_url = URLUtils.join_url(current_url, path)
                     await page.goto(sitemap_url)
                     content = await page.text_content("body") or ""
 
@@ -298,8 +306,6 @@ class LinkExtractor(BaseExtractor):
                         sitemap_links.extend(urls)
                     elif path.endswith("robots.txt"):
                         # 从robots.txt查找sitemap
-                        import re
-
                         sitemap_matches = re.findall(
                             r"Sitemap:\s*(.+)", content, re.IGNORECASE
                         )
@@ -344,35 +350,30 @@ class LinkExtractor(BaseExtractor):
             result = await self.extract(page)
             links = result["links"]
 
-            # 分析链接分布
-            navigation_links = [link for link in links if link["inNavigation"]]
-            content_links = [link for link in links if link["inMainContent"]]
-
-            # 按父元素分类
-            by_parent = {}
+            # 单次遍历完成分布、父元素和域名统计
+            navigation_count = 0
+            content_count = 0
+            by_parent: Dict[str, int] = {}
+            by_domain: Dict[str, int] = {}
             for link in links:
+                if link["inNavigation"]:
+                    navigation_count += 1
+                if link["inMainContent"]:
+                    content_count += 1
+
                 parent = link["parentTag"]
-                if parent not in by_parent:
-                    by_parent[parent] = []
-                by_parent[parent].append(link)
+                by_parent[parent] = by_parent.get(parent, 0) + 1
 
-            # 按域名分类
-            by_domain = {}
-            for link in links:
                 domain = link["domain"]
-                if domain not in by_domain:
-                    by_domain[domain] = []
-                by_domain[domain].append(link)
+                by_domain[domain] = by_domain.get(domain, 0) + 1
 
             return {
                 "url": page.url,
                 "total_links": len(links),
-                "navigation_links": len(navigation_links),
-                "content_links": len(content_links),
-                "by_parent_tag": {tag: len(links) for tag, links in by_parent.items()},
-                "by_domain": {
-                    domain: len(links) for domain, links in by_domain.items()
-                },
+                "navigation_links": navigation_count,
+                "content_links": content_count,
+                "by_parent_tag": by_parent,
+                "by_domain": by_domain,
                 "unique_domains": len(by_domain),
                 "analysis_timestamp": time.time(),
             }
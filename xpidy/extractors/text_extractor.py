@@ -94,18 +94,14 @@ class TextExtractor(BaseExtractor):
 
         for name, selector in selectors.items():
             try:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    if len(elements) == 1:
-                        text = await elements[0].text_content()
-                        extracted_data[name] = await self._clean_text(text or "")
-                    else:
-                        texts = []
-                        for element in elements:
-                            text = await element.text_content()
-                            if text:
-                                texts.append(await self._clean_text(text))
-                        extracted_data[name] = texts
+                # 一次调用读取全部匹配元素的文本
+                texts = await page.locator(selector).all_text_contents()
+                if len(texts) == 1:
+                    extracted_data[name] = await self._clean_text(texts[0])
+                elif texts:
+                    extracted_data[name] = [
+                        await self._clean_text(text) for text in texts if text
+                    ]
                 else:
                     extracted_data[name] = ""
             except Exception as e:
@@ -188,9 +184,8 @@ class TextExtractor(BaseExtractor):
         if self.config.content_selectors:
             for selector in self.config.content_selectors:
                 try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        text = await element.text_content()
+                    # 一次调用读取全部匹配元素的文本
+                    for text in await page.locator(selector).all_text_contents():
                         if text and len(text.strip()) >= self.config.min_text_length:
                             content_parts.append(await self._clean_text(text))
                 except Exception:
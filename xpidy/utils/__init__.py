@@ -4,7 +4,10 @@
 
 from .cache import CacheManager
 from .content_utils import ContentUtils
+from .json_utils import json_dumps, json_loads
+from .loop import run_async
 from .proxy import ProxyManager
+from .rate_limiter import TokenBucket
 from .retry import RetryManager
 from .stats import StatsCollector
 from .url_utils import URLUtils
@@ -16,4 +19,8 @@ __all__ = [
     "StatsCollector",
     "URLUtils",
     "ContentUtils",
+    "TokenBucket",
+    "run_async",
+    "json_loads",
+    "json_dumps",
 ]
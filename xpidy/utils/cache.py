@@ -28,6 +28,8 @@ class CacheConfig(BaseModel):
 class CacheEntry:
     """缓存条目"""
 
+    __slots__ = ("data", "created_at", "ttl", "access_count", "last_access")
+
     def __init__(self, data: Any, ttl: Optional[int] = None):
         self.data = data
         self.created_at = datetime.now()
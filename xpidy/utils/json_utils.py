@@ -0,0 +1,28 @@
+"""
+JSON 序列化工具
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖（pip install xpidy[speed]）
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """解析JSON，已安装 orjson 时使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """序列化为JSON字符串（保留非ASCII字符），indent为True时缩进2空格"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
@@ -0,0 +1,26 @@
+"""
+事件循环工具
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选依赖（pip install xpidy[speed]）
+    uvloop = None
+
+T = TypeVar("T")
+
+
+async def _run_eager(main: Coroutine[Any, Any, T]) -> T:
+    """启用 eager 任务工厂运行协程，无需挂起的任务（如命中缓存）在创建时即完成"""
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await main
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """运行协程入口，已安装 uvloop 时使用 uvloop 事件循环"""
+    if uvloop is not None:
+        return uvloop.run(_run_eager(main))
+    return asyncio.run(_run_eager(main))
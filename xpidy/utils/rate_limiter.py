@@ -0,0 +1,49 @@
+"""
+令牌桶限流器
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """令牌桶限流器
+
+    令牌按 rate（个/秒）持续补充，最多累积 capacity 个；acquire 在令牌不足时等待，
+    等待者按先来后到的顺序获得令牌。
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate 和 capacity 必须大于0")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """按流逝时间补充令牌"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1):
+        """获取指定数量的令牌，不足时等待补充"""
+        if tokens > self.capacity:
+            raise ValueError(f"请求的令牌数 {tokens} 超过桶容量 {self.capacity}")
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    @property
+    def available(self) -> float:
+        """当前可用令牌数"""
+        self._refill()
+        return self._tokens
@@ -4,6 +4,7 @@
 
 import asyncio
 import random
+import time
 from enum import Enum
 from typing import Any, Callable, List, Optional, Union
 
@@ -18,6 +19,7 @@ class RetryStrategy(str, Enum):
     EXPONENTIAL = "exponential"
     LINEAR = "linear"
     RANDOM = "random"
+    DECORRELATED = "decorrelated"
 
 
 class RetryConfig(BaseModel):
@@ -30,6 +32,10 @@ class RetryConfig(BaseModel):
     backoff_factor: float = 2.0
     jitter: bool = True
     retry_on_exceptions: List[type] = []
+    # 所有尝试及等待的总时长上限（秒），None表示不限制
+    max_total_time: Optional[float] = None
+    # 进一步按异常内容判断是否重试，返回False时直接抛出
+    retry_if: Optional[Callable[[Exception], bool]] = None
 
 
 class RetryManager:
@@ -48,6 +54,7 @@ class RetryManager:
         """异步重试装饰器"""
         config = retry_config or self.config
         last_exception = None
+        start_time = time.monotonic()
 
         for attempt in range(config.max_attempts):
             try:
@@ -70,11 +77,24 @@ class RetryManager:
                         )
                         raise
 
+                if config.retry_if is not None and not config.retry_if(e):
+                    logger.warning(f"异常不满足重试条件，直接抛出: {e}")
+                    raise
+
                 if attempt == config.max_attempts - 1:
                     logger.error(f"重试失败，已达到最大重试次数 {config.max_attempts}")
                     break
 
                 delay = self._calculate_delay(attempt, config)
+                if (
+                    config.max_total_time is not None
+                    and time.monotonic() - start_time + delay >= config.max_total_time
+                ):
+                    logger.error(
+                        f"重试失败，已超过总时长上限 {config.max_total_time}秒"
+                    )
+                    break
+
                 logger.warning(f"第 {attempt + 1} 次尝试失败: {e}，{delay:.2f}秒后重试")
                 await asyncio.sleep(delay)
 
@@ -91,6 +111,11 @@ class RetryManager:
             delay = config.base_delay * (attempt + 1)
         elif config.strategy == RetryStrategy.RANDOM:
             delay = random.uniform(config.base_delay, config.max_delay)
+        elif config.strategy == RetryStrategy.DECORRELATED:
+            # 去相关抖动：上限按3倍递增并随机取值，避免并发任务同步重试
+            delay = random.uniform(
+                config.base_delay, config.base_delay * 3 ** (attempt + 1)
+            )
         else:
             delay = config.base_delay
 
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestStats:
     """请求统计"""
 
@@ -35,7 +35,7 @@ class RequestStats:
         return datetime.fromtimestamp(self.start_time)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """会话统计"""
 
@@ -3,11 +3,43 @@ URL工具类
 """
 
 import re
-from typing import List, Optional, Set, Tuple
-from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse, urlunparse
+from functools import lru_cache
+from typing import Callable, List, Optional, Set, Tuple
+from urllib.parse import (
+    ParseResult,
+    parse_qs,
+    quote,
+    unquote,
+    urljoin,
+    urlparse,
+    urlunparse,
+)
 
 from loguru import logger
 
+# 正则元字符，不含这些字符（或仅含转义标点）的模式可按纯文本匹配
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+def _unescape_literal(pattern: str) -> Optional[str]:
+    """模式为纯文本时返回对应的字符串，否则返回None"""
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            # \d、\w 等转义字母表示字符类，不是纯文本
+            if char.isalnum():
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in _REGEX_METACHARS:
+            return None
+        else:
+            chars.append(char)
+    return None if escaped else "".join(chars)
+
 
 class URLUtils:
     """URL工具类"""
@@ -15,6 +47,14 @@ class URLUtils:
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """检查URL是否有效"""
+        if not isinstance(url, str):
+            return False
+        return URLUtils._is_valid_url_cached(url)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_url_cached(url: str) -> bool:
+        """检查URL是否有效（按URL缓存结果）"""
         try:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
@@ -35,41 +75,79 @@ class URLUtils:
                 url = "https://" + url
 
         try:
-            parsed = urlparse(url)
-
-            # 移除默认端口
-            netloc = parsed.netloc
-            if ":80" in netloc and parsed.scheme == "http":
-                netloc = netloc.replace(":80", "")
-            elif ":443" in netloc and parsed.scheme == "https":
-                netloc = netloc.replace(":443", "")
-
-            # 标准化路径
-            path = parsed.path
-            if not path:
-                path = "/"
+            return URLUtils._normalize_parsed(urlparse(url))
+        except Exception as e:
+            logger.warning(f"URL标准化失败: {url} - {e}")
+            return url
 
-            # 重建URL
-            normalized = urlunparse(
-                (
-                    parsed.scheme,
-                    netloc,
-                    path,
-                    parsed.params,
-                    parsed.query,
-                    parsed.fragment,
-                )
+    @staticmethod
+    def _normalize_parsed(parsed: ParseResult) -> str:
+        """根据已解析的URL生成标准化URL"""
+        # 移除默认端口
+        netloc = parsed.netloc
+        if ":80" in netloc and parsed.scheme == "http":
+            netloc = netloc.replace(":80", "")
+        elif ":443" in netloc and parsed.scheme == "https":
+            netloc = netloc.replace(":443", "")
+
+        # 标准化路径
+        path = parsed.path
+        if not path:
+            path = "/"
+
+        # 重建URL
+        return urlunparse(
+            (
+                parsed.scheme,
+                netloc,
+                path,
+                parsed.params,
+                parsed.query,
+                parsed.fragment,
             )
+        )
 
-            return normalized
+    @staticmethod
+    def parse_all(url: str) -> Tuple[bool, str, Optional[str]]:
+        """一次解析同时得到 (是否有效, 标准化URL, 域名)，无效URL返回 (False, "", None)"""
+        if not isinstance(url, str):
+            return False, "", None
+        return URLUtils._parse_all_cached(url)
 
-        except Exception as e:
-            logger.warning(f"URL标准化失败: {url} - {e}")
-            return url
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_all_cached(url: str) -> Tuple[bool, str, Optional[str]]:
+        """parse_all 的按URL缓存实现"""
+        try:
+            parsed = urlparse(url)
+        except Exception:
+            return False, "", None
+
+        if not (parsed.scheme and parsed.netloc):
+            return False, "", None
+
+        if url.startswith(("http://", "https://")):
+            try:
+                normalized = URLUtils._normalize_parsed(parsed)
+            except Exception as e:
+                logger.warning(f"URL标准化失败: {url} - {e}")
+                normalized = url
+        else:
+            normalized = URLUtils.normalize_url(url)
+
+        return True, normalized, parsed.netloc.lower()
 
     @staticmethod
     def extract_domain(url: str) -> Optional[str]:
         """提取域名"""
+        if not isinstance(url, str):
+            return None
+        return URLUtils._extract_domain_cached(url)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_domain_cached(url: str) -> Optional[str]:
+        """提取域名（按URL缓存结果）"""
         try:
             parsed = urlparse(url)
             # 检查是否有有效的netloc
@@ -256,9 +334,73 @@ class URLUtils:
             logger.error(f"正则表达式错误: {pattern} - {e}")
             return urls
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def compile_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+        """
+        逐个编译为忽略大小写的正则并缓存
+
+        各模式单独编译，内联标志（如 ``(?i)``）和分组编号的含义保持不变。
+        """
+        return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def compile_url_matcher(
+        patterns: Tuple[str, ...],
+    ) -> Optional[Callable[[str], bool]]:
+        """
+        构建忽略大小写的URL模式匹配函数，任一模式匹配即返回True，空模式返回None
+
+        形如 ``^前缀``、``后缀$`` 及不含元字符的纯文本模式分别用 startswith、endswith、
+        in 判断，无需进入正则引擎；其余模式逐个编译为正则。
+        """
+        if not patterns:
+            return None
+
+        prefixes, suffixes, substrings, others = [], [], [], []
+        for pattern in patterns:
+            anchored_start = pattern.startswith("^")
+            anchored_end = pattern.endswith("$") and not pattern.endswith("\\$")
+            body = pattern[int(anchored_start) : len(pattern) - int(anchored_end)]
+            literal = _unescape_literal(body)
+            if literal is None or (anchored_start and anchored_end):
+                others.append(pattern)
+            elif anchored_start:
+                prefixes.append(literal.lower())
+            elif anchored_end:
+                suffixes.append(literal.lower())
+            else:
+                substrings.append(literal.lower())
+
+        prefix_tuple, suffix_tuple = tuple(prefixes), tuple(suffixes)
+        has_literals = bool(prefixes or suffixes or substrings)
+        regexes = URLUtils.compile_patterns(tuple(others))
+
+        def matches(url: str) -> bool:
+            if has_literals:
+                lowered = url.lower()
+                if prefix_tuple and lowered.startswith(prefix_tuple):
+                    return True
+                if suffix_tuple and lowered.endswith(suffix_tuple):
+                    return True
+                if any(substring in lowered for substring in substrings):
+                    return True
+            return any(regex.search(url) for regex in regexes)
+
+        return matches
+
     @staticmethod
     def get_file_extension_from_url(url: str) -> Optional[str]:
         """从URL获取文件扩展名"""
+        if not isinstance(url, str):
+            return None
+        return URLUtils._get_file_extension_from_url_cached(url)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_file_extension_from_url_cached(url: str) -> Optional[str]:
+        """从URL获取文件扩展名（按URL缓存结果）"""
         try:
             parsed = urlparse(url)
             path = parsed.path